@@ -2,9 +2,68 @@
 """Example of integrating MaskingEngine with LLMs while preserving placeholders."""
 
 import json
+import re
+import threading
+from typing import Any, Optional, Set
+
 import openai  # Example with OpenAI, but works with any LLM
 from maskingengine import Sanitizer, RehydrationPipeline, RehydrationStorage
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None  # type: ignore[assignment]
+
+# Placeholder format produced by the masker: <<TYPE_HASH_INDEX>>
+PLACEHOLDER_PATTERN = re.compile(r"<<[A-Z0-9_]+_[A-F0-9]{6}_\d+>>")
+
+
+def _compile_placeholder_database() -> Any:
+    """Compile the placeholder pattern into a Hyperscan database if available."""
+    if hyperscan is None:
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[PLACEHOLDER_PATTERN.pattern.encode("utf-8")],
+        ids=[0],
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+    )
+    return database
+
+
+PLACEHOLDER_DATABASE = _compile_placeholder_database()
+
+
+def find_placeholders(text: str) -> Set[str]:
+    """Return the set of placeholder tokens in text."""
+    if PLACEHOLDER_DATABASE is None:
+        return set(PLACEHOLDER_PATTERN.findall(text))
+
+    # Hyperscan reports byte offsets, so slice the encoded text
+    data = text.encode("utf-8")
+    found: Set[str] = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        found.add(data[start:end].decode("utf-8"))
+
+    PLACEHOLDER_DATABASE.scan(data, match_event_handler=on_match)
+    return found
+
+
+# Build the sanitizer and storage once and share them across calls
+_PIPELINE: Optional[RehydrationPipeline] = None
+_PIPELINE_LOCK = threading.Lock()
+
+
+def get_pipeline() -> RehydrationPipeline:
+    """Get or create the shared rehydration pipeline."""
+    global _PIPELINE
+    if _PIPELINE is None:
+        with _PIPELINE_LOCK:
+            if _PIPELINE is None:
+                _PIPELINE = RehydrationPipeline(Sanitizer(), RehydrationStorage())
+    return _PIPELINE
+
 
 def create_llm_prompt_with_placeholder_preservation(user_content: str) -> str:
     """
@@ -26,9 +85,7 @@ def safe_llm_processing_example():
     """Demonstrate safe LLM processing with PII masking and rehydration."""
 
     # Setup MaskingEngine
-    sanitizer = Sanitizer()
-    storage = RehydrationStorage()
-    pipeline = RehydrationPipeline(sanitizer, storage)
+    pipeline = get_pipeline()
 
     # Original user input with PII
     user_input = """
@@ -220,13 +277,9 @@ def validate_placeholder_preservation(original_masked: str, llm_response: str) -
 
     Returns True if all placeholders from original are present in response.
     """
-    import re
-
     # Extract placeholders from both texts
-    placeholder_pattern = r"<<[A-Z0-9_]+_[A-F0-9]{6}_\d+>>"
-
-    original_placeholders = set(re.findall(placeholder_pattern, original_masked))
-    response_placeholders = set(re.findall(placeholder_pattern, llm_response))
+    original_placeholders = find_placeholders(original_masked)
+    response_placeholders = find_placeholders(llm_response)
 
     # Check if all original placeholders are preserved
     missing_placeholders = original_placeholders - response_placeholders
@@ -272,9 +325,7 @@ def production_integration_example():
             return f"I received your request: {masked_content}"
 
     # Demo the production flow
-    sanitizer = Sanitizer()
-    storage = RehydrationStorage()
-    pipeline = RehydrationPipeline(sanitizer, storage)
+    pipeline = get_pipeline()
 
     user_input = "Please analyze the email from support@company.com about user john@example.com"
     session_id = "prod_session_456"
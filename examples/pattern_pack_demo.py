@@ -6,7 +6,7 @@ This script demonstrates the YAML pattern pack system that allows users to:
 1. Use the default pattern pack with universal and country-specific rules
 2. Create custom pattern packs for organization-specific PII
 3. Combine multiple pattern packs
-4. Benefit from context keyword validation for stronger detection
+4. Detect PII the same way with or without surrounding context keywords
 """
 
 from maskingengine import Sanitizer, Config
@@ -102,10 +102,10 @@ def main():
         except Exception as e:
             print(f"  Error: {e}")
 
-    # Demo 4: Context keyword validation
-    print(f"\n\n🎯 Demo 4: Context Keyword Validation")
+    # Demo 4: Context-independent detection
+    print(f"\n\n🎯 Demo 4: Context-Independent Detection")
     print("-" * 40)
-    print("Pattern packs include context keywords to reduce false positives:")
+    print("Patterns match on their own, with or without nearby context keywords:")
 
     context_tests = [
         ("With Context", "Please provide your DNI: 12345678Z for verification"),
@@ -121,9 +121,9 @@ def main():
             masked, mask_map = sanitizer.sanitize(text)
             print(f"  Output: {masked}")
             if mask_map:
-                print(f"    ✅ PII detected (context matched)")
+                print(f"    ✅ PII detected")
             else:
-                print(f"    ❌ No PII detected (context not matched)")
+                print(f"    ❌ No PII detected")
         except Exception as e:
             print(f"  Error: {e}")
 
@@ -133,7 +133,7 @@ def main():
     print("• Default pack: Universal + country-specific patterns")
     print("• Custom packs: Organization-specific patterns")
     print("• Combined packs: Best of both worlds")
-    print("• Context validation: Reduces false positives")
+    print("• Validation: Luhn checks reduce credit card false positives")
     print("• YAML format: Easy to create and maintain")
 
     print(f"\n📁 Pattern Pack Files:")
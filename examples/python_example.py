@@ -2,27 +2,29 @@
 """Example of using MaskingEngine Python API directly."""
 
 import json
-from maskingengine import sanitize, rehydrate
-from maskingengine.core.config import SanitizerConfig
+from maskingengine import Sanitizer, Config, Rehydrator
 
 
 def main():
     """Demonstrate direct Python API usage."""
     print("🚀 MaskingEngine Python API Example\n")
 
+    sanitizer = Sanitizer()
+    rehydrator = Rehydrator()
+
     # Example 1: Basic usage with default configuration
     print("Example 1: Basic Usage")
     print("-" * 40)
 
     text = "Contact John Doe at john.doe@example.com or call 555-123-4567."
-    result = sanitize(text)
+    sanitized, mask_map = sanitizer.sanitize(text)
 
     print(f"Original: {text}")
-    print(f"Sanitized: {result.sanitized_content}")
-    print(f"Mask map: {json.dumps(result.mask_map, indent=2)}")
+    print(f"Sanitized: {sanitized}")
+    print(f"Mask map: {json.dumps(mask_map, indent=2)}")
 
     # Rehydrate
-    restored = rehydrate(result.sanitized_content, result.mask_map)
+    restored = rehydrator.rehydrate(sanitized, mask_map)
     print(f"Restored: {restored}")
     print(f"Match: {restored == text}\n")
 
@@ -30,19 +32,16 @@ def main():
     print("Example 2: Custom Configuration")
     print("-" * 40)
 
-    config = SanitizerConfig(
+    config = Config(
         min_confidence=0.8,
-        placeholder_prefix="REDACTED_",
-        whitelist={"Apple", "iPhone"},
-        enable_ner=True,
-        enable_regex=True,
+        whitelist=["Apple", "iPhone"],
     )
 
     text2 = "Tim Cook (CEO of Apple) can be reached at tcook@apple.com about iPhone plans."
-    result2 = sanitize(text2, config=config)
+    sanitized2, _ = Sanitizer(config).sanitize(text2)
 
     print(f"Original: {text2}")
-    print(f"Sanitized: {result2.sanitized_content}")
+    print(f"Sanitized: {sanitized2}")
     print(f"(Note: 'Apple' and 'iPhone' were whitelisted)\n")
 
     # Example 3: JSON content
@@ -59,28 +58,26 @@ def main():
         "account": {"number": "ACC-12345", "balance": 1500.00},
     }
 
-    json_str = json.dumps(json_data, indent=2)
-    result3 = sanitize(json_str, format="json")
+    sanitized3, mask_map3 = sanitizer.sanitize(json_data, format="json")
 
-    print(f"Original JSON:\n{json_str}")
-    print(f"\nSanitized JSON:\n{result3.sanitized_content}")
-    print(f"\nDetected {len(result3.mask_map)} PII entities")
+    print(f"Original JSON:\n{json.dumps(json_data, indent=2)}")
+    print(f"\nSanitized JSON:\n{json.dumps(sanitized3, indent=2)}")
+    print(f"\nDetected {len(mask_map3)} PII entities")
 
     # Restore JSON
-    restored_json = rehydrate(result3.sanitized_content, result3.mask_map, format="json")
-    restored_data = json.loads(restored_json)
+    restored_data = rehydrator.rehydrate(sanitized3, mask_map3)
     print(f"\nRestored data matches: {restored_data == json_data}\n")
 
     # Example 4: Regex-only detection (faster)
     print("Example 4: Regex-only Detection")
     print("-" * 40)
 
-    config_regex = SanitizerConfig(enable_ner=False, enable_regex=True)
+    regex_sanitizer = Sanitizer(Config(regex_only=True))
     text4 = "Email: test@example.com, Phone: 555-0123, Name: Bob Johnson"
-    result4 = sanitize(text4, config=config_regex)
+    sanitized4, _ = regex_sanitizer.sanitize(text4)
 
     print(f"Original: {text4}")
-    print(f"Sanitized (regex only): {result4.sanitized_content}")
+    print(f"Sanitized (regex only): {sanitized4}")
     print(f"(Note: Name not detected without NER)\n")
 
     # Example 5: Batch processing
@@ -94,18 +91,16 @@ def main():
         "Server IP: 192.168.1.50",
     ]
 
-    masked_docs = []
-    all_masks = {}
+    # One call detects PII in all documents and batches NER inference across them
+    results = sanitizer.sanitize_batch(documents)
 
-    for i, doc in enumerate(documents):
-        result = sanitize(doc)
-        masked_docs.append(result.sanitized_content)
-        # Prefix masks with document ID to avoid collisions
-        for k, v in result.mask_map.items():
-            all_masks[f"doc{i}_{k}"] = v
+    # Placeholder indices keep increasing across documents, so mask maps never collide
+    all_masks = {}
+    for _, doc_mask_map in results:
+        all_masks.update(doc_mask_map)
 
     print("Batch results:")
-    for original, masked in zip(documents, masked_docs):
+    for original, (masked, _) in zip(documents, results):
         print(f"  {original} → {masked}")
 
     print(f"\nTotal PII detected across all documents: {len(all_masks)}\n")
@@ -115,14 +110,14 @@ def main():
     print("-" * 40)
 
     try:
-        # Invalid format
-        sanitize("test", format="invalid")
+        # Input over the size limit
+        sanitizer.sanitize("x" * (Config.MAX_TEXT_LENGTH + 1))
     except ValueError as e:
-        print(f"Expected error for invalid format: {e}")
+        print(f"Expected error for oversized input: {e}")
 
     try:
         # Invalid configuration
-        SanitizerConfig(min_confidence=1.5)  # > 1.0
+        Config(regex_engine="pcre")
     except ValueError as e:
         print(f"Expected error for invalid config: {e}")
 
@@ -1,9 +1,35 @@
 """MaskingEngine: A local-first, privacy-by-design PII sanitizer system."""
 
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "1.2.0"
 
-from .sanitizer import Sanitizer
-from .config import Config
-from .rehydrator import Rehydrator, RehydrationStorage, RehydrationPipeline
+if TYPE_CHECKING:
+    from .sanitizer import Sanitizer
+    from .config import Config
+    from .rehydrator import Rehydrator, RehydrationStorage, RehydrationPipeline
 
 __all__ = ["Sanitizer", "Config", "Rehydrator", "RehydrationStorage", "RehydrationPipeline"]
+
+# Public names and the submodules defining them, imported on first access (PEP 562)
+_EXPORTS = {
+    "Sanitizer": "sanitizer",
+    "Config": "config",
+    "Rehydrator": "rehydrator",
+    "RehydrationStorage": "rehydrator",
+    "RehydrationPipeline": "rehydrator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,25 +1,67 @@
 """MaskingEngine REST API using FastAPI."""
 
+import copy
+import hashlib
+import json
 import os
-from typing import Optional, Dict, Any, List, Union
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterator, List, Union, Tuple, FrozenSet
 from fastapi import FastAPI, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from maskingengine import Sanitizer, Config, Rehydrator, RehydrationPipeline, RehydrationStorage
 from maskingengine.core import ConfigResolver
-from maskingengine.pattern_packs import PatternPackLoader
-import yaml
+from maskingengine.detectors import load_ner_model
+from maskingengine.pipeline import StreamingTextProcessor
+from maskingengine.pattern_packs import PatternPackLoader, load_yaml
 from pathlib import Path
 
-
 # Get configuration from environment or use defaults
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
 API_PORT = int(os.getenv("API_PORT", "8000"))
+# Each worker process loads its own NER model, so memory grows with the worker count
+API_WORKERS = int(os.getenv("API_WORKERS", "1"))
 API_TITLE = os.getenv("API_TITLE", "MaskingEngine API")
 API_DESCRIPTION = os.getenv("API_DESCRIPTION", "Local-first PII sanitization service")
 API_VERSION = os.getenv("API_VERSION", "1.01.00")
 CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
+SANITIZE_CACHE_SIZE = int(os.getenv("SANITIZE_CACHE_SIZE", "0"))
+SANITIZE_CACHE_TTL = float(os.getenv("SANITIZE_CACHE_TTL", "300"))
+REGEX_ENGINE = os.getenv("REGEX_ENGINE", "re")
+NER_BACKEND = os.getenv("NER_BACKEND", "torch")
+API_WARMUP = os.getenv("API_WARMUP", "true").lower() == "true"
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", "65536"))
+# NER models requests may ask for, besides the built-in one. Each is downloaded and
+# kept loaded, so clients cannot pick arbitrary Hugging Face repos
+API_NER_MODELS = frozenset(
+    [Config.NER_MODEL_PATH]
+    + [m.strip() for m in os.getenv("API_NER_MODELS", "").split(",") if m.strip()]
+)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(content)
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits, which orjson rejects but json writes
+                pass
+        return super().render(content)
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -28,8 +70,18 @@ app = FastAPI(
     version=API_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
 )
 
+
+# Startup event rather than lifespan=, which needs a newer FastAPI than we support
+@app.on_event("startup")
+async def warmup() -> None:
+    """Warm up the NER model in each worker before it serves traffic."""
+    if API_WARMUP:
+        await run_in_threadpool(warmup_ner_model)
+
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -59,6 +111,10 @@ class SanitizeRequest(BaseModel):
     strict_validation: bool = Field(
         True, description="Enable strict validation (e.g., Luhn check for credit cards)"
     )
+    ner_model: Optional[str] = Field(
+        None, description="NER model from API_NER_MODELS (defaults to the built-in model)"
+    )
+    quantize: bool = Field(False, description="Quantize the NER model to int8 (faster on CPU)")
 
 
 class SanitizeResponse(BaseModel):
@@ -102,6 +158,8 @@ class SessionSanitizeRequest(BaseModel):
         None, description="Minimum confidence threshold for NER"
     )
     strict_validation: bool = Field(True, description="Enable strict validation")
+    ner_model: Optional[str] = Field(None, description="NER model from API_NER_MODELS")
+    quantize: bool = Field(False, description="Quantize the NER model to int8 (faster on CPU)")
 
 
 class SessionSanitizeResponse(BaseModel):
@@ -192,6 +250,118 @@ class DiscoveryResponse(BaseModel):
     profiles: List[ProfileInfo] = Field([], description="Available configuration profiles")
 
 
+@lru_cache(maxsize=64)
+def _get_config(
+    pattern_packs: Tuple[str, ...],
+    whitelist: FrozenSet[str],
+    min_confidence: Optional[float],
+    strict_validation: bool,
+    regex_only: bool,
+    ner_model: Optional[str] = None,
+    quantize: bool = False,
+) -> Config:
+    """Build a Config once per distinct request option set and reuse it."""
+    return Config(
+        pattern_packs=list(pattern_packs),
+        whitelist=list(whitelist),
+        min_confidence=min_confidence,
+        strict_validation=strict_validation,
+        regex_only=regex_only,
+        ner_model=ner_model,
+        ner_quantize=quantize,
+        regex_engine=REGEX_ENGINE,
+        ner_backend=NER_BACKEND,
+    )
+
+
+def _request_options(request: Union[SanitizeRequest, SessionSanitizeRequest]) -> Tuple[Any, ...]:
+    """Normalize a sanitize request's options into a hashable key."""
+    return (
+        tuple(request.pattern_packs or ["default"]),
+        frozenset(request.whitelist or []),
+        request.min_confidence,
+        request.strict_validation,
+        request.regex_only,
+        request.ner_model,
+        request.quantize,
+    )
+
+
+def get_request_config(request: Union[SanitizeRequest, SessionSanitizeRequest]) -> Config:
+    """Get the shared Config matching a sanitize request's options.
+
+    Raises:
+        ValueError: If the request asks for a NER model not in API_NER_MODELS
+    """
+    if request.ner_model is not None and request.ner_model not in API_NER_MODELS:
+        raise ValueError(f"NER model not allowed: {request.ner_model}")
+    return _get_config(*_request_options(request))
+
+
+class SanitizeResultCache:
+    """Thread-safe LRU cache of sanitize results keyed by content hash and options.
+
+    Entries hold raw PII from the mask maps, so they expire after ttl seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self.maxsize > 0
+
+    @staticmethod
+    def make_key(request: SanitizeRequest) -> Optional[Tuple[Any, ...]]:
+        """Build a cache key from a digest of the content plus the request options.
+
+        Key order is kept, since it decides placeholder numbering. Returns None for
+        content too deeply nested to serialize.
+        """
+        content = request.content
+        try:
+            raw = content if isinstance(content, str) else json.dumps(content)
+        except RecursionError:
+            return None
+        digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+        return (digest, isinstance(content, str), request.format, _request_options(request))
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """Return a copy of the cached result, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: Tuple[Any, ...], result: Tuple[Any, Dict[str, str]]) -> None:
+        """Store a copy of a result, evicting the least recently used entry."""
+        if self.maxsize <= 0:
+            return
+        entry = (time.monotonic() + self.ttl, copy.deepcopy(result))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+sanitize_cache = SanitizeResultCache(SANITIZE_CACHE_SIZE, SANITIZE_CACHE_TTL)
+
+
 # Initialize rehydration system
 rehydration_storage = RehydrationStorage()
 rehydration_pipeline = None  # Will be initialized with first sanitizer
@@ -206,7 +376,41 @@ def get_rehydration_pipeline() -> RehydrationPipeline:
     return rehydration_pipeline
 
 
+# Cached result of the health self-test (NER enabled flag), computed on first probe
+ner_enabled_status: Optional[bool] = None
+
+
+def _default_config() -> Config:
+    """Get the shared Config used by requests with default options."""
+    return _get_config(("default",), frozenset(), None, True, False)
+
+
+def preload_ner_model() -> None:
+    """Load the default NER model into this process so forked workers can share it."""
+    config = _default_config()
+    if config.NER_ENABLED:
+        load_ner_model(config.NER_MODEL_PATH, config.NER_QUANTIZE, config.NER_BACKEND)
+
+
+def warmup_ner_model() -> None:
+    """Run one sanitization so the first request does not pay for model setup."""
+    Sanitizer(_default_config()).sanitize("Warmup request from John Smith in Berlin")
+
+
+def get_ner_enabled_status() -> bool:
+    """Run the sanitizer self-test once and cache whether NER is enabled."""
+    global ner_enabled_status
+    if ner_enabled_status is None:
+        # Test basic functionality
+        sanitizer = Sanitizer()
+        sanitizer.sanitize("test@example.com")
+        ner_enabled_status = sanitizer.config.NER_ENABLED
+    return ner_enabled_status
+
+
 # API Endpoints
+# Sanitize/rehydrate endpoints are CPU-bound, so they are declared as plain ``def``
+# and Starlette runs them in its threadpool instead of blocking the event loop.
 @app.get("/", response_model=Dict[str, Any])
 async def root() -> Dict[str, Any]:
     """Root endpoint providing API information."""
@@ -230,15 +434,11 @@ async def root() -> Dict[str, Any]:
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+def health_check() -> HealthResponse:
     """Health check endpoint."""
     try:
-        # Test basic functionality
-        sanitizer = Sanitizer()
-        test_content, test_map = sanitizer.sanitize("test@example.com")
-
         return HealthResponse(
-            status="healthy", version=API_VERSION, ner_enabled=sanitizer.config.NER_ENABLED
+            status="healthy", version=API_VERSION, ner_enabled=get_ner_enabled_status()
         )
     except Exception as e:
         raise HTTPException(
@@ -247,28 +447,33 @@ async def health_check() -> HealthResponse:
         )
 
 
-@app.post("/sanitize", response_model=SanitizeResponse)
-async def sanitize_content(request: SanitizeRequest) -> SanitizeResponse:
+@app.post("/sanitize", response_model=None, responses={200: {"model": SanitizeResponse}})
+def sanitize_content(request: SanitizeRequest) -> Dict[str, Any]:
     """Sanitize content by masking PII entities."""
     try:
-        # Create configuration from request
-        config = Config(
-            pattern_packs=request.pattern_packs or ["default"],
-            whitelist=request.whitelist or [],
-            min_confidence=request.min_confidence,
-            strict_validation=request.strict_validation,
-            regex_only=request.regex_only,
-        )
+        # Identical content and options always produce the same result
+        cache_key = sanitize_cache.make_key(request) if sanitize_cache.enabled else None
+        cached = sanitize_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            sanitized_content, mask_map = cached
+        else:
+            # Get (cached) configuration for the request options
+            config = get_request_config(request)
 
-        # Create sanitizer
-        sanitizer = Sanitizer(config)
+            # Create sanitizer
+            sanitizer = Sanitizer(config)
 
-        # Perform sanitization
-        sanitized_content, mask_map = sanitizer.sanitize(request.content, format=request.format)
+            # Perform sanitization
+            sanitized_content, mask_map = sanitizer.sanitize(request.content, format=request.format)
+            if cache_key is not None:
+                sanitize_cache.put(cache_key, (sanitized_content, mask_map))
 
-        return SanitizeResponse(
-            sanitized_content=sanitized_content, mask_map=mask_map, detection_count=len(mask_map)
-        )
+        # Return a plain dict to skip response model validation on the hot path
+        return {
+            "sanitized_content": sanitized_content,
+            "mask_map": mask_map,
+            "detection_count": len(mask_map),
+        }
 
     except ValueError as e:
         raise HTTPException(
@@ -280,8 +485,50 @@ async def sanitize_content(request: SanitizeRequest) -> SanitizeResponse:
         )
 
 
-@app.post("/rehydrate", response_model=RehydrateResponse)
-async def rehydrate_content(request: RehydrateRequest) -> RehydrateResponse:
+def _sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Event with a JSON payload."""
+    payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + payload + b"\n\n"
+
+
+@app.post("/sanitize/stream")
+def sanitize_stream(request: SanitizeRequest) -> StreamingResponse:
+    """Sanitize large text content, streaming each masked chunk as a Server-Sent Event."""
+    if not isinstance(request.content, str) or request.format not in (None, "text"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid request: streaming supports plain text content only",
+        )
+
+    try:
+        config = get_request_config(request)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid request: {str(e)}"
+        )
+
+    sanitizer = Sanitizer(config)
+    chunks = StreamingTextProcessor.from_string_lines(
+        request.content, STREAM_CHUNK_SIZE, config.MAX_TEXT_LENGTH
+    )
+
+    def events() -> Iterator[bytes]:
+        detection_count = 0
+        try:
+            for masked_chunk, mask_map in sanitizer.sanitize_stream(chunks):
+                detection_count += len(mask_map)
+                yield _sse_event("mask", {"chunk": masked_chunk, "mask_map": mask_map})
+        except Exception as e:
+            # The 200 status is already sent, so failures are reported in the stream
+            yield _sse_event("error", {"detail": f"Internal error: {str(e)}"})
+            return
+        yield _sse_event("done", {"detection_count": detection_count})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.post("/rehydrate", response_model=None, responses={200: {"model": RehydrateResponse}})
+def rehydrate_content(request: RehydrateRequest) -> Dict[str, Any]:
     """Rehydrate masked content using provided mask map."""
     try:
         rehydrator = Rehydrator()
@@ -308,9 +555,7 @@ async def rehydrate_content(request: RehydrateRequest) -> RehydrateResponse:
         rehydrated_content = rehydrator.rehydrate(request.masked_content, request.mask_map)
         placeholders_found = len(rehydrator.extract_placeholders(request.masked_content))
 
-        return RehydrateResponse(
-            rehydrated_content=rehydrated_content, placeholders_found=placeholders_found
-        )
+        return {"rehydrated_content": rehydrated_content, "placeholders_found": placeholders_found}
 
     except ValueError as e:
         raise HTTPException(
@@ -322,22 +567,17 @@ async def rehydrate_content(request: RehydrateRequest) -> RehydrateResponse:
         )
 
 
-@app.post("/session/sanitize", response_model=SessionSanitizeResponse)
-async def session_sanitize(request: SessionSanitizeRequest) -> SessionSanitizeResponse:
+@app.post(
+    "/session/sanitize", response_model=None, responses={200: {"model": SessionSanitizeResponse}}
+)
+def session_sanitize(request: SessionSanitizeRequest) -> Dict[str, Any]:
     """Sanitize content and store mask map for later rehydration."""
     try:
-        # Create configuration from request
-        config = Config(
-            pattern_packs=request.pattern_packs or ["default"],
-            whitelist=request.whitelist or [],
-            min_confidence=request.min_confidence,
-            strict_validation=request.strict_validation,
-            regex_only=request.regex_only,
-        )
+        # Get (cached) configuration for the request options
+        config = get_request_config(request)
 
-        # Get rehydration pipeline
-        pipeline = get_rehydration_pipeline()
-        pipeline.sanitizer = Sanitizer(config)  # Update with new config
+        # Per-request pipeline over the shared storage, since requests run concurrently
+        pipeline = RehydrationPipeline(Sanitizer(config), rehydration_storage)
 
         # Perform sanitization with session storage
         sanitized_content, storage_path = pipeline.sanitize_with_session(
@@ -348,12 +588,12 @@ async def session_sanitize(request: SessionSanitizeRequest) -> SessionSanitizeRe
         mask_map = pipeline.storage.load_mask_map(request.session_id)
         detection_count = len(mask_map) if mask_map else 0
 
-        return SessionSanitizeResponse(
-            sanitized_content=sanitized_content,
-            session_id=request.session_id,
-            storage_path=storage_path,
-            detection_count=detection_count,
-        )
+        return {
+            "sanitized_content": sanitized_content,
+            "session_id": request.session_id,
+            "storage_path": storage_path,
+            "detection_count": detection_count,
+        }
 
     except ValueError as e:
         raise HTTPException(
@@ -365,8 +605,8 @@ async def session_sanitize(request: SessionSanitizeRequest) -> SessionSanitizeRe
         )
 
 
-@app.post("/session/rehydrate", response_model=RehydrateResponse)
-async def session_rehydrate(request: SessionRehydrateRequest) -> RehydrateResponse:
+@app.post("/session/rehydrate", response_model=None, responses={200: {"model": RehydrateResponse}})
+def session_rehydrate(request: SessionRehydrateRequest) -> Dict[str, Any]:
     """Rehydrate content using stored session mask map."""
     try:
         pipeline = get_rehydration_pipeline()
@@ -386,9 +626,7 @@ async def session_rehydrate(request: SessionRehydrateRequest) -> RehydrateRespon
         rehydrator = Rehydrator()
         placeholders_found = len(rehydrator.extract_placeholders(request.masked_content))
 
-        return RehydrateResponse(
-            rehydrated_content=rehydrated_content, placeholders_found=placeholders_found
-        )
+        return {"rehydrated_content": rehydrated_content, "placeholders_found": placeholders_found}
 
     except HTTPException:
         raise  # Re-raise HTTP exceptions
@@ -464,7 +702,7 @@ async def discover_capabilities() -> DiscoveryResponse:
         models_file = Path(__file__).parent.parent / "core" / "models.yaml"
         if models_file.exists():
             with open(models_file, "r") as f:
-                models_data = yaml.safe_load(f) or {}
+                models_data = load_yaml(f) or {}
                 for model in models_data.get("models", []):
                     models.append(
                         ModelInfo(
@@ -531,7 +769,7 @@ async def list_models() -> List[ModelInfo]:
             return models  # Return empty list if no models file
 
         with open(models_file, "r") as f:
-            models_data = yaml.safe_load(f) or {}
+            models_data = load_yaml(f) or {}
 
         for model in models_data.get("models", []):
             models.append(
@@ -596,7 +834,7 @@ async def list_profiles() -> List[ProfileInfo]:
         profiles_file = Path(__file__).parent.parent / "core" / "profiles.yaml"
         if profiles_file.exists():
             with open(profiles_file, "r") as f:
-                profiles_data = yaml.safe_load(f) or {}
+                profiles_data = load_yaml(f) or {}
 
             for profile_name, profile_data in profiles_data.items():
                 profiles.append(
@@ -621,4 +859,14 @@ async def list_profiles() -> List[ProfileInfo]:
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host=API_HOST, port=API_PORT)
+    # Sanitization is CPU-bound, so scale across processes (API_WORKERS) rather than threads.
+    # "auto" picks uvloop and httptools when they are installed.
+    uvicorn.run(
+        "maskingengine.api.main:app",
+        host=API_HOST,
+        port=API_PORT,
+        workers=API_WORKERS,
+        loop="auto",
+        http="auto",
+        log_level=os.getenv("API_LOG_LEVEL", "warning"),
+    )
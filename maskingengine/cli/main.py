@@ -2,17 +2,37 @@
 
 import json
 import sys
-import yaml
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 import click
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from maskingengine import Sanitizer, Config, Rehydrator, RehydrationPipeline, RehydrationStorage
 from maskingengine.core import ConfigResolver
+from maskingengine.pattern_packs import load_yaml
 from maskingengine.pipeline import StreamingMaskingSession, StreamingTextProcessor
 
 
+def _write_mask_map(path: str, mask_map: Dict[str, str]) -> None:
+    """Write a mask map as indented JSON, using orjson when available."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(mask_map, option=orjson.OPT_INDENT_2))
+    else:
+        Path(path).write_text(json.dumps(mask_map, indent=2))
+
+
+def _read_mask_map(path: str) -> Dict[str, str]:
+    """Read a mask map JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    return json.loads(Path(path).read_text())
+
+
 @click.group()
 @click.version_option(version="1.2.0", prog_name="maskingengine")
 def cli() -> None:
@@ -54,6 +74,15 @@ def cli() -> None:
 )
 @click.option("--stdin", is_flag=True, help="Read input from stdin")
 @click.option("--profile", help="Use a predefined configuration profile")
+@click.option(
+    "--batch",
+    type=click.Path(exists=True, file_okay=False),
+    help="Mask every .txt file in a directory (-o sets the output directory)",
+)
+@click.option("--ner-model", help="NER model path or Hugging Face id (defaults to built-in model)")
+@click.option(
+    "--quantize/--no-quantize", default=False, help="Quantize the NER model to int8 (faster on CPU)"
+)
 def mask(
     input_file: Optional[str],
     output: Optional[str],
@@ -63,6 +92,9 @@ def mask(
     whitelist: tuple,
     stdin: bool,
     profile: Optional[str],
+    batch: Optional[str],
+    ner_model: Optional[str],
+    quantize: bool,
 ) -> None:
     """Mask PII in text, JSON, or HTML content.
 
@@ -73,12 +105,15 @@ def mask(
         maskingengine mask input.txt --pattern-packs default --pattern-packs healthcare -o output.txt
         maskingengine mask input.txt --profile healthcare-en -o output.txt
         maskingengine mask input.txt --whitelist "support@company.com" -o output.txt
+        maskingengine mask --batch docs/ --regex-only -o masked/
     """
     try:
-        # Read input content
-        if stdin or input_file is None:
+        # Read input content; plain-text files are streamed in chunks and
+        # batch directories are read together further below
+        stream_file = batch is None and format == "text" and not stdin and input_file is not None
+        if batch is None and (stdin or input_file is None):
             content = sys.stdin.read().strip()
-        else:
+        elif batch is None and not stream_file:
             content = Path(input_file).read_text()
 
         # Create configuration
@@ -124,7 +159,9 @@ def mask(
                         "strict_validation",
                         "min_confidence",
                     ]
-                }
+                },
+                ner_model=ner_model,
+                ner_quantize=quantize,
             )
         else:
             # Direct configuration without profile
@@ -132,11 +169,21 @@ def mask(
                 pattern_packs=list(pattern_packs) if pattern_packs else ["default"],
                 whitelist=list(whitelist) if whitelist else [],
                 regex_only=regex_only,
+                ner_model=ner_model,
+                ner_quantize=quantize,
             )
 
         # Create sanitizer
         sanitizer = Sanitizer(config)
 
+        if batch is not None:
+            _mask_batch_dir(sanitizer, batch, output)
+            return
+
+        if stream_file and input_file is not None:
+            _mask_text_file_stream(sanitizer, input_file, output)
+            return
+
         # Perform sanitization
         masked_content, mask_map = sanitizer.sanitize(content, format=format)
 
@@ -162,6 +209,51 @@ def mask(
         sys.exit(1)
 
 
+def _mask_text_file_stream(sanitizer: Sanitizer, input_file: str, output: Optional[str]) -> None:
+    """Mask a plain-text file chunk by chunk, writing each chunk as it is sanitized."""
+    entity_count = 0
+
+    if output:
+        entity_count = len(sanitizer.sanitize_file(input_file, output))
+        click.echo(f"✅ Sanitized content written to: {output}")
+    else:
+        chunks = StreamingTextProcessor.from_file_lines(
+            input_file, max_length=sanitizer.config.MAX_TEXT_LENGTH
+        )
+        for masked_chunk, chunk_map in sanitizer.sanitize_stream(chunks):
+            click.echo(masked_chunk, nl=False)
+            entity_count += len(chunk_map)
+        click.echo()
+
+    # Display summary
+    if entity_count:
+        click.echo(f"🔍 Detected {entity_count} PII entities", err=True)
+
+
+def _mask_batch_dir(sanitizer: Sanitizer, batch_dir: str, output_dir: Optional[str]) -> None:
+    """Mask all .txt files in a directory with a single batched sanitize call."""
+    files = sorted(
+        path for path in Path(batch_dir).glob("*.txt") if not path.name.endswith(".sanitized.txt")
+    )
+    if not files:
+        click.echo(f"⚠️  Warning: No .txt files found in {batch_dir}", err=True)
+        return
+
+    out_dir = Path(output_dir) if output_dir else Path(batch_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    results = sanitizer.sanitize_batch([path.read_text() for path in files])
+    entity_count = 0
+    for path, (masked_content, mask_map) in zip(files, results):
+        (out_dir / f"{path.stem}.sanitized.txt").write_text(masked_content)
+        entity_count += len(mask_map)
+    click.echo(f"✅ Sanitized {len(files)} files written to: {out_dir}")
+
+    # Display summary
+    if entity_count:
+        click.echo(f"🔍 Detected {entity_count} PII entities", err=True)
+
+
 @cli.command()
 @click.option("--session-id", help="Session ID for rehydration testing")
 def test(session_id: Optional[str]) -> None:
@@ -228,7 +320,7 @@ def rehydrate(masked_file: str, mask_map_file: str, output: Optional[str]) -> No
         masked_content = Path(masked_file).read_text()
 
         # Read mask map
-        mask_map = json.loads(Path(mask_map_file).read_text())
+        mask_map = _read_mask_map(mask_map_file)
 
         # Perform rehydration
         rehydrator = Rehydrator()
@@ -346,7 +438,7 @@ def session_sanitize(
         if mask_map_output:
             mask_map = storage.load_mask_map(session_id)
             if mask_map:
-                Path(mask_map_output).write_text(json.dumps(mask_map, indent=2))
+                _write_mask_map(mask_map_output, mask_map)
                 click.echo(f"💾 Mask map written to: {mask_map_output}")
             else:
                 click.echo(f"⚠️  Warning: No mask map found for session '{session_id}'", err=True)
@@ -496,7 +588,7 @@ def validate_config(config_file: Optional[str], profile: Optional[str]) -> None:
                     loaded = json.load(f)
                     user_config = loaded if isinstance(loaded, dict) else {}
                 else:
-                    loaded = yaml.safe_load(f)
+                    loaded = load_yaml(f)
                     user_config = loaded if isinstance(loaded, dict) else {}
 
         # Resolve and validate
@@ -541,7 +633,7 @@ def list_models() -> None:
             return
 
         with open(models_file, "r") as f:
-            models_data = yaml.safe_load(f) or {}
+            models_data = load_yaml(f) or {}
 
         models = models_data.get("models", [])
         if not models:
@@ -620,7 +712,7 @@ def test_sample(
                     loaded = json.load(f)
                     user_config = loaded if isinstance(loaded, dict) else {}
                 else:
-                    loaded = yaml.safe_load(f)
+                    loaded = load_yaml(f)
                     user_config = loaded if isinstance(loaded, dict) else {}
 
         # Add CLI overrides
@@ -733,7 +825,7 @@ def list_profiles() -> None:
             return
 
         with open(profiles_file, "r") as f:
-            profiles_data = yaml.safe_load(f) or {}
+            profiles_data = load_yaml(f) or {}
 
         if not profiles_data:
             click.echo("📭 No profiles configured")
@@ -45,9 +45,15 @@ class Config:
 
     # Performance settings
     MAX_TEXT_LENGTH = 1_000_000  # 1MB
+    SLOW_WARNING_MS = 100  # Warn about sanitize calls slower than this; 0 disables the check
     NER_ENABLED = True
     NER_MODEL_PATH = "yonigo/distilbert-base-multilingual-cased-pii"
     NER_MIN_CONFIDENCE = 0.5
+    NER_QUANTIZE = False  # int8 dynamic quantization of the NER model (CPU)
+    # "re2" (google-re2) or "hyperscan" prefilter ASCII text in one pass; "auto" picks
+    # hyperscan, then re2, whichever is installed, and re otherwise
+    REGEX_ENGINE = "re"
+    NER_BACKEND = "torch"  # "onnx" runs the NER model on ONNX Runtime via optimum
 
     def __init__(
         self,
@@ -57,6 +63,10 @@ class Config:
         min_confidence: Optional[float] = None,
         strict_validation: bool = True,
         regex_only: bool = False,
+        ner_model: Optional[str] = None,
+        ner_quantize: bool = False,
+        regex_engine: Optional[str] = None,
+        ner_backend: Optional[str] = None,
     ) -> None:
         """Initialize configuration with customizable options."""
         # Pattern pack configuration
@@ -73,12 +83,27 @@ class Config:
         self.whitelist = set(whitelist) if whitelist else set()
         self.placeholder_prefix = placeholder_prefix
         self.strict_validation = strict_validation
+        if regex_engine is not None:
+            if regex_engine not in ("re", "re2", "hyperscan", "auto"):
+                raise ValueError(
+                    f"Unknown regex engine: {regex_engine} "
+                    "(expected 're', 're2', 'hyperscan' or 'auto')"
+                )
+            self.REGEX_ENGINE = regex_engine
 
         # NER configuration
         if regex_only:
             self.NER_ENABLED = False
         if min_confidence is not None:
             self.NER_MIN_CONFIDENCE = min_confidence
+        if ner_model:
+            self.NER_MODEL_PATH = ner_model
+        if ner_quantize:
+            self.NER_QUANTIZE = True
+        if ner_backend is not None:
+            if ner_backend not in ("torch", "onnx"):
+                raise ValueError(f"Unknown NER backend: {ner_backend} (expected 'torch' or 'onnx')")
+            self.NER_BACKEND = ner_backend
 
         # Build combined patterns from packs
         self.PATTERNS = self._build_patterns()
@@ -4,8 +4,8 @@ import os
 import json
 from pathlib import Path
 from typing import Dict, Optional, Any
-import yaml
 
+from ..pattern_packs import load_yaml
 from .validator import ConfigValidator
 
 
@@ -45,7 +45,7 @@ class ConfigResolver:
 
         try:
             with open(profiles_file, "r") as f:
-                profiles_data = yaml.safe_load(f) or {}
+                profiles_data = load_yaml(f) or {}
             # Remove description from each profile before returning
             return {
                 name: {k: v for k, v in profile.items() if k != "description"}
@@ -131,7 +131,7 @@ class ConfigResolver:
                     result = json.load(f)
                     return result if isinstance(result, dict) else {}
                 else:
-                    result = yaml.safe_load(f)
+                    result = load_yaml(f)
                     return result if isinstance(result, dict) else {}
         except Exception as e:
             print(f"Warning: Could not load config from {resolved_path}: {e}")
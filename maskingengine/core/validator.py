@@ -4,12 +4,19 @@ import json
 import os
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
-import yaml
 
-try:
-    import jsonschema
-except ImportError:
-    jsonschema = None  # type: ignore[assignment]
+from ..pattern_packs import load_yaml
+
+
+def _import_jsonschema() -> Any:
+    """Import jsonschema on first use, or return None if it is not installed."""
+    # Importing it takes ~40ms, about half of CLI start-up, so only commands that
+    # actually validate a config pay for it
+    try:
+        import jsonschema
+    except ImportError:
+        return None
+    return jsonschema
 
 
 class ConfigValidator:
@@ -46,6 +53,7 @@ class ConfigValidator:
         if not self.schema:
             return True, ["Schema not found, skipping schema validation"]
 
+        jsonschema = _import_jsonschema()
         if jsonschema is None:
             return True, ["jsonschema package not installed, skipping schema validation"]
 
@@ -97,7 +105,7 @@ class ConfigValidator:
 
         try:
             with open(models_file, "r") as f:
-                models_data = yaml.safe_load(f) or {}
+                models_data = load_yaml(f) or {}
 
             registered_models = {model["id"] for model in models_data.get("models", [])}
 
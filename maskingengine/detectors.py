@@ -1,13 +1,404 @@
 """Simplified detectors module with regex and NER detection."""
 
+import contextlib
+import platform
 import re
+import tempfile
+import threading
+import warnings
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Tuple, Optional, Dict, Any, Pattern
 from .config import Config
+from .pattern_packs import compile_pattern
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse  # type: ignore[no-redef]
+
+try:
+    import re2
+except ImportError:
+    re2 = None  # type: ignore[assignment]
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None  # type: ignore[assignment]
+
+# Numbered or named backreferences, which cannot survive joining patterns together
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+# Syntax that can behave differently at the end of a text than next to a newline:
+# \A/\Z anchors, DOTALL or negated inline flags, and lookarounds that could see a
+# newline (\s, \W, \D, escapes, negated classes, nested groups)
+_NEWLINE_SENSITIVE = re.compile(
+    r"\\[AZz]|\(\?[aiLmsux]*[s-]|\(\?<?[=!][^()]*(?:\\[snWDxuUN0-9]|\[\^|\()"
+)
+
+# A lookaround assertion without nested groups, e.g. (?<![a-z]) or (?=.*key)
+_LOOKAROUND = re.compile(r"(?<!\\)\(\?<?[=!][^()]*\)")
+
+# "(?" inside a character class, which _LOOKAROUND could mistake for an assertion
+_GROUP_IN_CLASS = re.compile(r"\[[^\]]*\(\?")
+
+# ASCII characters that str patterns treat as whitespace (\s) but bytes or RE2 patterns
+# do not, so text containing them must be scanned by the str patterns
+_UNICODE_ONLY_SPACE = re.compile(r"[\x0b\x1c-\x1f]")
+
+# A capitalized word (\b[A-Z][a-z]). Testing the boundary behind the capital instead of
+# before it lets re skip ahead to capitals instead of checking \b at every position
+_CAPITALIZED_WORD = re.compile(r"[A-Z](?<!\w.)[a-z]")
+
+# Characters too common in ordinary text to be worth testing for before a scan
+_COMMON_CHARS = frozenset(" .,-0123456789")
+
+_NON_DIGIT = re.compile(r"\D")
+# ASCII digit -> its value, and -> the digit sum of twice its value, for the Luhn check
+_LUHN_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]))
+
+
+@lru_cache(maxsize=1024)
+def compile_linear_pattern(pattern: str) -> Any:
+    """
+    Compile a pattern with RE2 for guaranteed linear-time matching.
+
+    Returns:
+        RE2 regexp, or None if RE2 is not installed or the pattern uses syntax
+        it does not support (e.g. lookarounds)
+    """
+    if re2 is None:
+        return None
+    options = re2.Options()
+    options.case_sensitive = False
+    options.log_errors = False
+    try:
+        return re2.compile("(?m)" + pattern, options)
+    except re2.error:
+        return None
+
+
+@lru_cache(maxsize=256)
+def compile_fused_pattern(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """
+    Join patterns into one alternation that finds their leftmost match.
+
+    Built once per process for each pattern list and shared by every detector.
+
+    Returns:
+        The compiled alternation, or None if the patterns cannot be fused
+    """
+    # Backreferences would point at the wrong groups once patterns are joined
+    if len(patterns) < 2 or any(_BACKREFERENCE.search(p) for p in patterns):
+        return None
+    try:
+        return compile_pattern("|".join(f"(?:{p})" for p in patterns))
+    except re.error:
+        # e.g. inline global flags: scan the patterns one by one
+        return None
+
+
+@lru_cache(maxsize=1024)
+def required_character(pattern: str) -> Optional[str]:
+    """
+    Find a character every match of a pattern must contain, e.g. "@" for emails.
+
+    Only ASCII non-letters count, as patterns are compiled case-insensitively.
+    Text without the character cannot match, so the pattern need not scan it.
+
+    Returns:
+        The least common such character, or None if there is none
+    """
+    try:
+        items = sre_parse.parse(pattern, re.IGNORECASE | re.MULTILINE)
+    except Exception:
+        return None
+
+    required = []
+    for op, av in items:
+        # Top-level literals, alone or repeated at least once, appear in every match
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1 and len(av[2]) == 1:
+            op, av = av[2][0]
+        if op is sre_parse.LITERAL:
+            char = chr(av)
+            if char.isascii() and not char.isalpha():
+                required.append(char)
+
+    if not required:
+        return None
+    return min(required, key=lambda char: char in _COMMON_CHARS)
+
+
+@lru_cache(maxsize=1024)
+def compile_ascii_pattern(pattern: str) -> Optional[Pattern[bytes]]:
+    """
+    Compile a pattern for scanning ASCII text as bytes.
+
+    Bytes patterns skip Unicode case folding and character class lookups, which
+    makes them over twice as fast as the same str pattern on ASCII text.
+
+    Returns:
+        Bytes pattern, or None if the pattern is not plain ASCII
+    """
+    if not pattern.isascii():
+        return None
+    try:
+        return re.compile(pattern.encode("ascii"), re.IGNORECASE | re.MULTILINE)
+    except re.error:
+        # e.g. \N{...} or \u escapes, which only str patterns accept
+        return None
+
+
+def _prefilter_expression(pattern: str) -> str:
+    """
+    Drop lookaround assertions, which RE2 and Hyperscan do not support.
+
+    The result matches wherever the pattern does and possibly elsewhere, so it can
+    still rule patterns out and bound where their first match starts.
+    """
+    # "(?" inside a character class is literal text, not an assertion to drop
+    if _GROUP_IN_CLASS.search(pattern):
+        return pattern
+    return _LOOKAROUND.sub("", pattern)
+
+
+@lru_cache(maxsize=64)
+def compile_prefilter_set(patterns: Tuple[str, ...]) -> Tuple[Any, Tuple[Optional[int], ...]]:
+    """
+    Compile patterns into one RE2 set once per process.
+
+    Returns:
+        Tuple of (RE2 set or None, set id of each pattern or None where RE2 does
+        not support its syntax, e.g. backreferences)
+    """
+    options = re2.Options()
+    options.case_sensitive = False
+    options.log_errors = False
+    prefilter = re2.Set.SearchSet(options)
+
+    ids: List[Optional[int]] = []
+    for pattern in patterns:
+        try:
+            ids.append(prefilter.Add("(?m)" + _prefilter_expression(pattern)))
+        except re2.error:
+            ids.append(None)
+
+    if all(i is None for i in ids):
+        return None, tuple(ids)
+    prefilter.Compile()
+    return prefilter, tuple(ids)
+
+
+@lru_cache(maxsize=64)
+def compile_pattern_database(patterns: Tuple[str, ...]) -> Tuple[Any, Tuple[Optional[int], ...]]:
+    """
+    Compile patterns into one Hyperscan database once per process.
+
+    Returns:
+        Tuple of (database or None, expression id of each pattern or None where
+        Hyperscan does not support it, e.g. backreferences or non-ASCII patterns)
+    """
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE
+    flags |= hyperscan.HS_FLAG_SOM_LEFTMOST
+    expressions: List[bytes] = []
+    ids: List[Optional[int]] = []
+    for pattern in patterns:
+        if not pattern.isascii():
+            ids.append(None)
+            continue
+        expression = _prefilter_expression(pattern).encode("ascii")
+        try:
+            # Compile alone first so one unsupported pattern cannot fail the database
+            hyperscan.Database().compile(expressions=[expression], flags=[flags])
+        except hyperscan.error:
+            ids.append(None)
+            continue
+        ids.append(len(expressions))
+        expressions.append(expression)
+
+    if not expressions:
+        return None, tuple(ids)
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        flags=[flags] * len(expressions),
+    )
+    return database, tuple(ids)
+
+
+# Per-thread Hyperscan scratch space for each database
+_scratch = threading.local()
+
+
+# Loaded NER models keyed by (model_path, quantize, backend), shared by all detectors
+_ner_models: Dict[Tuple[str, bool, str], Tuple[Any, Any]] = {}
+_ner_pipelines: Dict[Tuple[str, bool, str], Any] = {}
+_ner_models_lock = threading.Lock()
+# One lock per model, held while it loads, so a slow download only blocks its own callers
+_ner_model_locks: Dict[Tuple[str, bool, str], threading.Lock] = {}
+
+# Threads running NER inference alongside the regex scan, created on first use
+_ner_executor: Optional[ThreadPoolExecutor] = None
+
+
+def load_ner_model(
+    model_path: str, quantize: bool = False, backend: str = "torch"
+) -> Tuple[Any, Any]:
+    """
+    Load a NER tokenizer and model once per process and reuse them.
+
+    Loading before worker processes fork (e.g. gunicorn --preload) lets all
+    workers share the weights copy-on-write.
+
+    Returns:
+        Tuple of (tokenizer, model), or (None, None) if the model is not available
+    """
+    key = (model_path, quantize, backend)
+    loaded = _ner_models.get(key)
+    if loaded is not None:
+        return loaded
+
+    with _ner_model_lock(key):
+        loaded = _ner_models.get(key)
+        if loaded is None:
+            try:
+                from transformers import AutoTokenizer, AutoModelForTokenClassification
+
+                tokenizer = AutoTokenizer.from_pretrained(model_path)
+                model = _load_onnx_model(model_path, quantize) if backend == "onnx" else None
+                if model is None:
+                    model = AutoModelForTokenClassification.from_pretrained(model_path)
+                    # Inference only: dropout off, whatever the checkpoint was saved in
+                    model.eval()
+                    if quantize:
+                        model = _quantize_model(model)
+            except (ImportError, OSError, Exception):
+                # Model not available, disable NER. Not cached, so a failure such as a
+                # dropped download is retried on the next call
+                return None, None
+            loaded = _ner_models[key] = (tokenizer, model)
+        return loaded
+
+
+def _ner_model_lock(key: Tuple[str, bool, str]) -> threading.Lock:
+    """Get the lock that serializes loading one NER model."""
+    with _ner_models_lock:
+        return _ner_model_locks.setdefault(key, threading.Lock())
+
+
+def _load_onnx_model(model_path: str, quantize: bool = False) -> Any:
+    """Load a token-classification model on ONNX Runtime, exporting it if needed."""
+    try:
+        from optimum.onnxruntime import ORTModelForTokenClassification
+    except ImportError:
+        print("Warning: optimum[onnxruntime] is not installed, using the torch NER backend")
+        return None
+
+    # Directories that already contain an exported model are loaded as-is
+    export = not (Path(model_path) / "model.onnx").exists()
+    model = ORTModelForTokenClassification.from_pretrained(model_path, export=export)
+    return _quantize_onnx_model(model) if quantize else model
+
+
+def _quantize_onnx_model(model: Any) -> Any:
+    """Apply int8 dynamic quantization to an ONNX Runtime model (VNNI on x86, i8mm on ARM)."""
+    try:
+        from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        if platform.machine().lower() in ("arm64", "aarch64"):
+            qconfig = AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+        else:
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+
+        # The loaded session keeps the model in memory, so the files can go once it is up
+        with tempfile.TemporaryDirectory(prefix="maskingengine-onnx-int8-") as save_dir:
+            ORTQuantizer.from_pretrained(model).quantize(
+                save_dir=save_dir, quantization_config=qconfig
+            )
+            return ORTModelForTokenClassification.from_pretrained(
+                save_dir, file_name="model_quantized.onnx"
+            )
+    except Exception as e:
+        # Quantization not available, keep the full-precision model
+        warnings.warn(f"ONNX int8 quantization failed, using the full-precision model: {e}")
+        return model
+
+
+def _quantize_model(model: Any) -> Any:
+    """Apply int8 dynamic quantization to the model's linear layers."""
+    try:
+        import torch
+
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception:
+        # Quantization backend not available, keep the full-precision model
+        return model
+
+
+def get_ner_pipeline(model_path: str, quantize: bool = False, backend: str = "torch") -> Any:
+    """Wrap a loaded NER model in a transformers pipeline once per process and reuse it."""
+    tokenizer, model = load_ner_model(model_path, quantize, backend)
+    key = (model_path, quantize, backend)
+    with _ner_model_lock(key):
+        if key not in _ner_pipelines:
+            half = backend == "torch" and not quantize
+            _ner_pipelines[key] = _build_ner_pipeline(model, tokenizer, half, quantize)
+        return _ner_pipelines[key]
+
+
+def _get_ner_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool for NER inference, creating it on first use."""
+    global _ner_executor
+    with _ner_models_lock:
+        if _ner_executor is None:
+            _ner_executor = ThreadPoolExecutor(thread_name_prefix="maskingengine-ner")
+        return _ner_executor
+
+
+def _inference_mode() -> Any:
+    """Context that disables autograd tracking for NER inference, if torch is available."""
+    try:
+        import torch
+    except ImportError:
+        return contextlib.nullcontext()
+    return torch.inference_mode()
+
+
+def _build_ner_pipeline(
+    model: Any, tokenizer: Any, half: bool = False, quantized: bool = False
+) -> Any:
+    """Build a NER pipeline on GPU when available, windowing texts longer than the model."""
+    import torch
+    from transformers import pipeline
+
+    # int8-quantized models only run on the CPU
+    device = 0 if torch.cuda.is_available() and not quantized else -1
+    if device == 0 and half:
+        # fp16 halves the weight bandwidth and runs the matmuls on tensor cores
+        model = model.half()
+
+    kwargs = {"model": model, "tokenizer": tokenizer, "aggregation_strategy": "simple"}
+    if getattr(tokenizer, "is_fast", False):
+        try:
+            # Long texts are split into overlapping windows instead of failing inference
+            return pipeline("ner", device=device, stride=128, **kwargs)
+        except TypeError:
+            # transformers < 4.26 has no stride option
+            pass
+    return pipeline("ner", device=device, **kwargs)
 
 
 class Detection:
     """Simple detection result tuple."""
 
+    __slots__ = ("type", "text", "start", "end")
+
     def __init__(self, type_: str, text: str, start: int, end: int) -> None:
         self.type = type_
         self.text = text
@@ -26,6 +417,40 @@ class RegexDetector:
         self.config = config or Config()
         self.patterns = self.config.PATTERNS
         self.compiled_patterns = self._compile_patterns()
+        self.fused_patterns = self._fuse_patterns()
+        self._ascii_patterns = self._compile_ascii_patterns()
+        self._required = self._find_required_characters()
+        self._required_chars = frozenset(self._required.values())
+        self._patterns_by_missing: Dict[frozenset, Dict[str, List[Pattern[str]]]] = {}
+        self._prefilter_ids: Dict[Pattern[str], int] = {}
+        self._prefilter: Any = None
+        self._linear_patterns: Dict[Pattern[str], Any] = {}
+        self.engine = self._resolve_engine()
+        if self.engine == "re2":
+            self._prefilter = self._build_prefilter()
+            if self._prefilter is not None:
+                self._linear_patterns = self._compile_linear_patterns()
+        elif self.engine == "hyperscan":
+            self._prefilter = self._build_pattern_database()
+        # Whether several texts can be scanned at once, joined by newlines
+        self._joinable = not any(_NEWLINE_SENSITIVE.search(p.pattern) for p in self._all_patterns())
+        # Types whose every pattern reports its leftmost match, so need no fused gate
+        self._located_types = {
+            name
+            for name, patterns in self.compiled_patterns.items()
+            if self.engine == "hyperscan"
+            and self._prefilter is not None
+            and all(p in self._prefilter_ids for p in patterns)
+        }
+
+    def _resolve_engine(self) -> str:
+        """Get the configured regex engine, choosing the fastest installed one for "auto"."""
+        engine = self.config.REGEX_ENGINE
+        if engine != "auto":
+            return engine
+        if hyperscan is not None:
+            return "hyperscan"
+        return "re2" if re2 is not None else "re"
 
     def _compile_patterns(self) -> Dict[str, List[Pattern[str]]]:
         """Pre-compile all regex patterns with error handling."""
@@ -42,7 +467,7 @@ class RegexDetector:
 
             for pattern in pattern_list:
                 try:
-                    compiled_pattern = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+                    compiled_pattern = compile_pattern(pattern)
                     compiled_patterns.append(compiled_pattern)
                 except re.error as e:
                     print(f"Warning: Invalid regex pattern in {name}: {pattern} - {e}")
@@ -54,52 +479,241 @@ class RegexDetector:
             compiled[name] = compiled_patterns
         return compiled
 
+    def _fuse_patterns(self) -> Dict[str, Pattern[str]]:
+        """Join each type's patterns into one alternation that finds its leftmost match."""
+        # Alternations stay per type on purpose: a single named-group alternation over
+        # every type (or re.Scanner, which builds the same thing) only yields
+        # non-overlapping matches, so a low-priority match would hide the overlapping
+        # ones _deduplicate needs, and it measured ~2.5x slower than these gates on re
+        fused = {}
+        for name, patterns in self.compiled_patterns.items():
+            if len(patterns) > 1:
+                gate = compile_fused_pattern(tuple(p.pattern for p in patterns))
+                if gate is not None:
+                    fused[name] = gate
+        return fused
+
+    def _compile_ascii_patterns(self) -> Dict[Pattern[str], Pattern[bytes]]:
+        """Map each pattern and fused gate to a bytes equivalent for ASCII text."""
+        ascii_patterns = {}
+        for pattern in self._all_patterns() + list(self.fused_patterns.values()):
+            compiled = compile_ascii_pattern(pattern.pattern)
+            if compiled is not None:
+                ascii_patterns[pattern] = compiled
+        return ascii_patterns
+
+    def _find_required_characters(self) -> Dict[Pattern[str], str]:
+        """Map each pattern that has one to a character all of its matches contain."""
+        required = {}
+        for pattern in self._all_patterns():
+            char = required_character(pattern.pattern)
+            if char is not None:
+                required[pattern] = char
+        return required
+
+    def _patterns_without(self, missing: frozenset) -> Dict[str, List[Pattern[str]]]:
+        """Get the patterns by type that can match text lacking the missing characters."""
+        type_patterns = self._patterns_by_missing.get(missing)
+        if type_patterns is None:
+            type_patterns = {}
+            for name, patterns in self.compiled_patterns.items():
+                kept = [p for p in patterns if self._required.get(p) not in missing]
+                if kept:
+                    type_patterns[name] = kept
+            self._patterns_by_missing[missing] = type_patterns
+        return type_patterns
+
+    def _all_patterns(self) -> List[Pattern[str]]:
+        """List every compiled pattern in detection order."""
+        return [pattern for patterns in self.compiled_patterns.values() for pattern in patterns]
+
+    def _build_prefilter(self) -> Any:
+        """Get the RE2 set that reports which of this detector's patterns match."""
+        if re2 is None:
+            print("Warning: google-re2 is not installed, falling back to the re engine")
+            return None
+
+        patterns = self._all_patterns()
+        prefilter, ids = compile_prefilter_set(tuple(p.pattern for p in patterns))
+        self._prefilter_ids = {p: i for p, i in zip(patterns, ids) if i is not None}
+        return prefilter
+
+    def _build_pattern_database(self) -> Any:
+        """Get the Hyperscan database that scans all of this detector's patterns at once."""
+        if hyperscan is None:
+            print("Warning: hyperscan is not installed, falling back to the re engine")
+            return None
+
+        patterns = self._all_patterns()
+        database, ids = compile_pattern_database(tuple(p.pattern for p in patterns))
+        self._prefilter_ids = {p: i for p, i in zip(patterns, ids) if i is not None}
+        return database
+
+    def _prefilter_hits(self, text: str, data: bytes) -> Dict[int, int]:
+        """Map each prefiltered pattern that matches text to where its first match starts.
+
+        data is text already encoded as ASCII, shared with the bytes patterns.
+        """
+        if self.engine == "re2":
+            return dict.fromkeys(self._prefilter.Match(text) or (), 0)
+
+        # Scratch space cannot be shared by concurrent scans, so keep one per thread
+        scratches = _scratch.__dict__.setdefault("by_database", {})
+        scratch = scratches.get(self._prefilter)
+        if scratch is None:
+            scratch = scratches[self._prefilter] = hyperscan.Scratch(self._prefilter)
+
+        starts: Dict[int, int] = {}
+
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+            if start < starts.get(pattern_id, start + 1):
+                starts[pattern_id] = start
+
+        # ASCII text, so byte offsets are character offsets
+        self._prefilter.scan(data, match_event_handler=on_match, scratch=scratch)
+        return starts
+
+    def _compile_linear_patterns(self) -> Dict[Pattern[str], Any]:
+        """Map each pattern RE2 supports to its RE2 equivalent for scanning."""
+        linear = {}
+        for pattern in self._all_patterns() + list(self.fused_patterns.values()):
+            compiled = compile_linear_pattern(pattern.pattern)
+            if compiled is not None:
+                linear[pattern] = compiled
+        return linear
+
     def detect(self, text: str) -> List[Tuple[str, str, int, int]]:
         """Detect PII using regex patterns with context validation."""
         detections = []
+        whitelist = {w.lower() for w in self.config.whitelist}
+
+        # RE2, Hyperscan and bytes patterns use ASCII classes such as \b, \d and \s,
+        # so they only handle ASCII text
+        hits = None
+        data = b""
+        linear: Dict[Pattern[str], Any] = {}
+        if text.isascii() and not _UNICODE_ONLY_SPACE.search(text):
+            data = text.encode("ascii")
+            linear = self._linear_patterns
+            if self._prefilter is not None:
+                # One linear-time pass finds which patterns can match at all
+                hits = self._prefilter_hits(text, data)
+
+        # Without a prefilter, substring tests rule out patterns needing a character
+        # the text lacks, e.g. emails in text without "@"
+        type_patterns = self.compiled_patterns
+        if hits is None and self._required_chars:
+            missing = frozenset(char for char in self._required_chars if char not in text)
+            if missing:
+                type_patterns = self._patterns_without(missing)
+
+        strict = self.config.strict_validation
+        for pii_type, patterns in type_patterns.items():
+            # Credit card matches must pass the Luhn check, decided once per type
+            luhn = strict and pii_type.upper() in ("CREDIT_CARD", "CREDIT_CARD_NUMBER")
+
+            # One pass over the text finds where the first match of any pattern starts,
+            # so types without matches are skipped and the rest resume from there
+            pos = 0
+            fused = self.fused_patterns.get(pii_type)
+            if fused is not None and (hits is None or pii_type not in self._located_types):
+                scanner, subject = self._scanner(fused, text, data, linear)
+                first = scanner.search(subject)
+                if first is None:
+                    continue
+                pos = first.start()
 
-        for pii_type, patterns in self.compiled_patterns.items():
             # Iterate through all patterns for this PII type
             for pattern in patterns:
-                for match in pattern.finditer(text):
-                    matched_text = match.group()
+                start_pos = pos
+                set_id = self._prefilter_ids.get(pattern)
+                if hits is not None and set_id is not None:
+                    if set_id not in hits:
+                        continue
+                    start_pos = max(pos, hits[set_id])
+
+                scanner, subject = self._scanner(pattern, text, data, linear)
+                for match in scanner.finditer(subject, start_pos):
                     start, end = match.start(), match.end()
+                    matched_text = text[start:end]
 
                     # Skip if in whitelist
-                    if matched_text.lower() in {w.lower() for w in self.config.whitelist}:
+                    if whitelist and matched_text.lower() in whitelist:
                         continue
 
                     # Special validation for credit cards (Luhn check)
-                    if (
-                        pii_type.upper() in ["CREDIT_CARD", "CREDIT_CARD_NUMBER"]
-                        and self.config.strict_validation
-                    ):
-                        if not self._luhn_check(matched_text):
-                            continue
+                    if luhn and not self._luhn_check(matched_text):
+                        continue
 
                     detections.append((pii_type, matched_text, start, end))
 
         return detections
 
+    def detect_batch(self, texts: List[str]) -> List[List[Tuple[str, str, int, int]]]:
+        """
+        Detect PII in several texts with one scan over them joined by newlines.
+
+        Short texts such as HTML fragments and JSON values would otherwise pay the
+        per-call overhead of detect once each. Patterns that might see past the end
+        of a text (see _NEWLINE_SENSITIVE) fall back to scanning texts one by one.
+
+        Returns:
+            One detection list per text, with offsets into that text
+        """
+        if len(texts) < 2 or not self._joinable:
+            return [self.detect(text) for text in texts]
+
+        # Offset of each text within the joined string
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        results: List[List[Tuple[str, str, int, int]]] = [[] for _ in texts]
+        rescan = set()
+        for pii_type, matched_text, start, end in self.detect("\n".join(texts)):
+            i = bisect_right(starts, start) - 1
+            base = starts[i]
+            if end > base + len(texts[i]):
+                # A match running across the newline may hide matches on either side,
+                # so the texts it touches are scanned on their own instead
+                rescan.update(range(i, bisect_right(starts, end - 1)))
+                continue
+            results[i].append((pii_type, matched_text, start - base, end - base))
+
+        for i in rescan:
+            results[i] = self.detect(texts[i])
+        return results
+
+    def _scanner(
+        self, pattern: Pattern[str], text: str, data: bytes, linear: Dict[Pattern[str], Any]
+    ) -> Tuple[Any, Any]:
+        """Pick the fastest equivalent of pattern and the text form it scans."""
+        if pattern in linear:
+            return linear[pattern], text
+        if data:
+            ascii_pattern = self._ascii_patterns.get(pattern)
+            if ascii_pattern is not None:
+                return ascii_pattern, data
+        return pattern, text
+
     def _luhn_check(self, card_number: str) -> bool:
         """Validate credit card using Luhn algorithm."""
         # Remove non-digits
-        digits = re.sub(r"\D", "", card_number)
+        digits = _NON_DIGIT.sub("", card_number)
 
         if len(digits) < 13 or len(digits) > 19:
             return False
+        if not digits.isascii():
+            # \d also matches other scripts' decimal digits
+            digits = "".join(str(int(digit)) for digit in digits)
 
-        # Luhn algorithm
-        total = 0
-        reverse_digits = digits[::-1]
-
-        for i, digit in enumerate(reverse_digits):
-            n = int(digit)
-            if i % 2 == 1:  # Every second digit from right
-                n *= 2
-                if n > 9:
-                    n = n // 10 + n % 10
-            total += n
+        # Luhn algorithm: every second digit from the right is doubled. Lookup tables
+        # map the digits to their contributions and sum() adds them up in C
+        data = digits.encode("ascii")
+        total = sum(data[-1::-2].translate(_LUHN_VALUES))
+        total += sum(data[-2::-2].translate(_LUHN_DOUBLED))
 
         return total % 10 == 0
 
@@ -126,14 +740,9 @@ class NERDetector:
         if self._model is None and not self._model_loading:
             self._model_loading = True
             try:
-                from transformers import AutoTokenizer, AutoModelForTokenClassification
-
-                self._tokenizer = AutoTokenizer.from_pretrained(self.model_path)
-                self._model = AutoModelForTokenClassification.from_pretrained(self.model_path)
-            except (ImportError, OSError, Exception):
-                # Model not available, disable NER
-                self._model = None
-                self._tokenizer = None
+                self._tokenizer, self._model = load_ner_model(
+                    self.model_path, self.config.NER_QUANTIZE, self.config.NER_BACKEND
+                )
             finally:
                 self._model_loading = False
         return self._model
@@ -150,47 +759,75 @@ class NERDetector:
             return []  # Skip if model not available
 
         # Quick filter to avoid NER overhead
-        if len(text) < 10 or not self._has_potential_entities(text):
+        if not self._is_candidate(text):
             return []
 
         try:
-            import torch
-            from transformers import pipeline
-
-            # Create NER pipeline
-            ner_pipeline = pipeline(
-                "ner",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                aggregation_strategy="simple",
-                device=0 if torch.cuda.is_available() else -1,
-            )
+            # Run inference without autograd bookkeeping
+            with _inference_mode():
+                entities = self._create_pipeline()(text)
+            return self._to_detections(text, entities)
+
+        except Exception as e:
+            # Graceful degradation on NER failure
+            return []
+
+    def detect_batch(
+        self, texts: List[str], batch_size: int = 16
+    ) -> List[List[Tuple[str, str, int, int]]]:
+        """Detect entities in several texts with batched NER inference."""
+        results: List[List[Tuple[str, str, int, int]]] = [[] for _ in texts]
+        if not self.model or not self.tokenizer:
+            return results  # Skip if model not available
 
-            # Run inference
-            entities = ner_pipeline(text)
-            detections = []
+        # Only send texts that pass the quick filter to the model
+        candidates = [i for i, text in enumerate(texts) if self._is_candidate(text)]
+        if not candidates:
+            return results
 
-            for entity in entities:
-                # Filter by confidence threshold
-                if entity["score"] >= self.min_confidence and len(entity["word"].strip()) > 1:
+        try:
+            # Run inference over all candidates in mini-batches
+            with _inference_mode():
+                outputs = self._create_pipeline()(
+                    [texts[i] for i in candidates], batch_size=batch_size
+                )
+                for i, entities in zip(candidates, outputs):
+                    results[i] = self._to_detections(texts[i], entities)
 
-                    # Map entity types to our format
-                    entity_type = self._map_entity_type(entity["entity_group"])
+        except Exception as e:
+            # Graceful degradation on NER failure
+            pass
 
-                    # Get the actual text from the original string
-                    actual_text = text[entity["start"] : entity["end"]]
+        return results
 
-                    # Skip if in whitelist
-                    if actual_text.lower() in {w.lower() for w in self.config.whitelist}:
-                        continue
+    def _create_pipeline(self) -> Any:
+        """Get the shared transformers NER pipeline around the loaded model."""
+        return get_ner_pipeline(self.model_path, self.config.NER_QUANTIZE, self.config.NER_BACKEND)
+
+    def _to_detections(
+        self, text: str, entities: List[Dict[str, Any]]
+    ) -> List[Tuple[str, str, int, int]]:
+        """Convert NER pipeline output for a text into detections."""
+        detections = []
+        whitelist = {w.lower() for w in self.config.whitelist}
 
-                    detections.append((entity_type, actual_text, entity["start"], entity["end"]))
+        for entity in entities:
+            # Filter by confidence threshold
+            if entity["score"] >= self.min_confidence and len(entity["word"].strip()) > 1:
 
-            return detections
+                # Map entity types to our format
+                entity_type = self._map_entity_type(entity["entity_group"])
 
-        except Exception as e:
-            # Graceful degradation on NER failure
-            return []
+                # Get the actual text from the original string
+                actual_text = text[entity["start"] : entity["end"]]
+
+                # Skip if in whitelist
+                if whitelist and actual_text.lower() in whitelist:
+                    continue
+
+                detections.append((entity_type, actual_text, entity["start"], entity["end"]))
+
+        return detections
 
     def _map_entity_type(self, entity_group: str) -> str:
         """Map DistilBERT PII model entity types to our standard format."""
@@ -213,14 +850,34 @@ class NERDetector:
         }
         return mapping.get(entity_group.upper(), entity_group.upper())
 
+    def _is_candidate(self, text: str) -> bool:
+        """Check whether text is long enough and capitalized enough to be worth NER."""
+        return len(text) >= 10 and self._has_potential_entities(text)
+
     def _has_potential_entities(self, text: str) -> bool:
         """Quick heuristic check for potential proper nouns."""
-        return re.search(r"\b[A-Z][a-z]+", text) is not None
+        return _CAPITALIZED_WORD.search(text) is not None
 
 
 class Detector:
     """Main detector that combines regex and NER."""
 
+    # Priority for PII types (higher = more specific/important), unlisted types get 1
+    TYPE_PRIORITIES = {
+        "EMAIL": 10,
+        "SSN": 10,
+        "CREDIT_CARD": 10,  # High confidence structured
+        "PHONE": 8,
+        "PHONE_US": 8,
+        "IPV4": 8,
+        "IPV6": 8,  # Medium confidence
+        "PERSON": 5,
+        "ORG": 5,
+        "ORGANIZATION": 5,
+        "GPE": 5,
+        "LOCATION": 5,  # NER types
+    }
+
     def __init__(self, config: Optional[Config] = None) -> None:
         self.config = config or Config()
         self.regex_detector = RegexDetector(self.config)
@@ -232,16 +889,37 @@ class Detector:
 
     def detect_all(self, text: str) -> List[Tuple[str, str, int, int]]:
         """Detect all PII using both regex and NER."""
-        # Start with regex (fast)
-        detections = self.regex_detector.detect(text)
+        ner = self.ner_detector
+        if ner and ner.model is not None and ner._is_candidate(text):
+            # Torch releases the GIL during inference, so the regex scan runs meanwhile
+            # and the call takes as long as the slower of the two instead of their sum
+            ner_future = _get_ner_executor().submit(ner.detect, text)
+            detections = self.regex_detector.detect(text)
+            detections.extend(ner_future.result())
+        else:
+            detections = self.regex_detector.detect(text)
+
+        # Deduplicate overlapping detections
+        return self._deduplicate(detections)
+
+    def detect_all_batch(self, texts: List[str]) -> List[List[Tuple[str, str, int, int]]]:
+        """Detect all PII in several texts, batching NER inference across them."""
+        # Repeated texts, e.g. the same value in many JSON records, are detected once
+        unique = list(dict.fromkeys(texts))
+        if len(unique) < len(texts):
+            found = dict(zip(unique, self.detect_all_batch(unique)))
+            return [list(found[text]) for text in texts]
+
+        batch_detections = self.regex_detector.detect_batch(texts)
 
         # Add NER detections if enabled
         if self.ner_detector:
-            ner_detections = self.ner_detector.detect(text)
-            detections.extend(ner_detections)
+            for detections, ner_detections in zip(
+                batch_detections, self.ner_detector.detect_batch(texts)
+            ):
+                detections.extend(ner_detections)
 
-        # Deduplicate overlapping detections
-        return self._deduplicate(detections)
+        return [self._deduplicate(detections) for detections in batch_detections]
 
     def _deduplicate(
         self, detections: List[Tuple[str, str, int, int]]
@@ -250,44 +928,35 @@ class Detector:
         if not detections:
             return []
 
-        # Sort by start position, then by priority
-        sorted_detections = sorted(detections, key=lambda d: (d[2], self._get_type_priority(d[0])))
+        # Look up each priority once and sort by start position, then by priority. The
+        # input index breaks ties, keeping the sort stable without a key function
+        priority = self.TYPE_PRIORITIES.get
+        sorted_detections = sorted(
+            (detection[2], priority(detection[0], 1), i, detection)
+            for i, detection in enumerate(detections)
+        )
 
         # Remove overlaps
         result = []
         last_end = -1
+        last_priority = 0
 
-        for detection in sorted_detections:
-            start = detection[2]
+        for start, detection_priority, _, detection in sorted_detections:
             end = detection[3]
 
             if start >= last_end:  # No overlap
                 result.append(detection)
                 last_end = end
+                last_priority = detection_priority
             else:
                 # Overlap - keep the one with higher priority
-                if result and self._get_type_priority(detection[0]) > self._get_type_priority(
-                    result[-1][0]
-                ):
+                if result and detection_priority > last_priority:
                     result[-1] = detection
                     last_end = end
+                    last_priority = detection_priority
 
         return result
 
     def _get_type_priority(self, pii_type: str) -> int:
         """Get priority for PII type (higher = more specific/important)."""
-        priority_map = {
-            "EMAIL": 10,
-            "SSN": 10,
-            "CREDIT_CARD": 10,  # High confidence structured
-            "PHONE": 8,
-            "PHONE_US": 8,
-            "IPV4": 8,
-            "IPV6": 8,  # Medium confidence
-            "PERSON": 5,
-            "ORG": 5,
-            "ORGANIZATION": 5,
-            "GPE": 5,
-            "LOCATION": 5,  # NER types
-        }
-        return priority_map.get(pii_type, 1)
+        return self.TYPE_PRIORITIES.get(pii_type, 1)
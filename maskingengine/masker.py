@@ -1,8 +1,18 @@
 """Simplified masker module for <<TYPE_HASH>> replacement."""
 
+from operator import itemgetter
 from typing import List, Tuple, Optional, Dict
 from .config import Config
 
+# NER entity labels that share a placeholder type with another label
+_TYPE_MAP = {
+    "PERSON": "PERSON",
+    "ORG": "ORGANIZATION",
+    "ORGANIZATION": "ORGANIZATION",
+    "GPE": "LOCATION",
+    "LOCATION": "LOCATION",
+}
+
 
 class Masker:
     """Simple masker that creates configurable placeholders."""
@@ -13,58 +23,82 @@ class Masker:
         self.type_hashes = type_hashes or Config.TYPE_HASHES
         self.type_counters: Dict[str, int] = {}
         self.config = config or Config()
+        # Per PII type: (normalized type, placeholder text before and after the index)
+        self._placeholder_parts: Dict[str, Tuple[str, str, str]] = {}
 
     def mask(
         self,
         text: str,
         detections: List[Tuple[str, str, int, int]],
         mask_map: Optional[Dict[str, str]] = None,
+        seen: Optional[Dict[Tuple[str, str], str]] = None,
     ) -> str:
-        """Apply masks to text using deterministic placeholders."""
+        """
+        Apply masks to text using deterministic placeholders.
+
+        Repeated values share a placeholder. Pass the same ``seen`` dict when masking
+        several pieces of one document so they share placeholders across calls.
+        """
         if not detections:
             return text
 
         # Sort detections in reverse order (right to left)
-        sorted_detections = sorted(detections, key=lambda d: d[2], reverse=True)
+        sorted_detections = sorted(detections, key=itemgetter(2), reverse=True)
 
-        # Apply masks from end to beginning to preserve positions
-        result = text
+        # Number placeholders from end to beginning, as masks have always been assigned
+        replacements = []
+        if seen is None:
+            seen = {}
         for detection in sorted_detections:
             pii_type, pii_text, start, end = detection
-            placeholder = self._get_placeholder(pii_type)
 
-            # Store original value in mask map if provided
+            # Repeated values share a placeholder
+            placeholder = seen.get((pii_type, pii_text))
+            if placeholder is None:
+                placeholder = seen[(pii_type, pii_text)] = self._get_placeholder(pii_type)
+
+            # Store original value in mask map if provided. Placeholders reused from an
+            # earlier call are added too, so the map covers everything in this text
             if mask_map is not None:
                 mask_map[placeholder] = pii_text
 
-            result = result[:start] + placeholder + result[end:]
+            replacements.append((start, end, placeholder))
 
-        return result
+        # Stitch the text together left to right in a single join
+        parts = []
+        cursor = 0
+        for start, end, placeholder in reversed(replacements):
+            parts.append(text[cursor:start])
+            parts.append(placeholder)
+            cursor = end
+        parts.append(text[cursor:])
+
+        return "".join(parts)
 
     def _get_placeholder(self, pii_type: str) -> str:
         """Generate deterministic placeholder for PII type with index."""
-        # Normalize type mapping for NER entities
-        type_map = {
-            "PERSON": "PERSON",
-            "ORG": "ORGANIZATION",
-            "ORGANIZATION": "ORGANIZATION",
-            "GPE": "LOCATION",
-            "LOCATION": "LOCATION",
-        }
-
-        normalized_type = type_map.get(pii_type, pii_type)
-        hash_value = self.type_hashes.get(normalized_type, "XXXXXX")
+        parts = self._placeholder_parts.get(pii_type)
+        if parts is None:
+            parts = self._placeholder_parts[pii_type] = self._build_placeholder_parts(pii_type)
+        normalized_type, head, tail = parts
 
         # Get and increment counter for this type
-        if normalized_type not in self.type_counters:
-            self.type_counters[normalized_type] = 0
-        self.type_counters[normalized_type] += 1
+        index = self.type_counters.get(normalized_type, 0) + 1
+        self.type_counters[normalized_type] = index
+
+        return f"{head}{index}{tail}"
+
+    def _build_placeholder_parts(self, pii_type: str) -> Tuple[str, str, str]:
+        """Work out a PII type's placeholder around its index, once per type."""
+        # Normalize type mapping for NER entities
+        normalized_type = _TYPE_MAP.get(pii_type, pii_type)
+        hash_value = self.type_hashes.get(normalized_type, "XXXXXX")
 
         # Use configured placeholder format
         if self.config.placeholder_prefix.startswith("<<"):
             # Default format: <<TYPE_HASH_INDEX>>
-            return f"<<{normalized_type}_{hash_value}_{self.type_counters[normalized_type]}>>"
+            return normalized_type, f"<<{normalized_type}_{hash_value}_", ">>"
         else:
             # Custom format: [PREFIX]TYPE_HASH_INDEX[/PREFIX]
             prefix = self.config.placeholder_prefix
-            return f"{prefix}{normalized_type}_{hash_value}_{self.type_counters[normalized_type]}{prefix}"
+            return normalized_type, f"{prefix}{normalized_type}_{hash_value}_", prefix
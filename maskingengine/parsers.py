@@ -3,7 +3,10 @@
 import json
 import re
 import copy
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Iterator, Union, Optional, Tuple
+
+# Immutable JSON leaf types, which copies of a document can share
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
 
 
 class TextChunk:
@@ -60,27 +63,49 @@ class JSONParser:
             data = json.loads(data)
 
         chunks: List[TextChunk] = []
-        JSONParser._extract_values(data, chunks, [])
+        JSONParser._extract_values(data, chunks)
         return chunks
 
     @staticmethod
-    def _extract_values(obj: Any, chunks: List[TextChunk], path: List[Union[str, int]]) -> None:
-        """Extract string values recursively."""
+    def _children(obj: Any) -> Optional[Iterator[Tuple[Union[str, int], Any]]]:
+        """Iterate a container's (key or index, value) pairs, or None for a leaf."""
+        if isinstance(obj, dict):
+            return iter(obj.items())
+        if isinstance(obj, list):
+            return enumerate(obj)
+        return None
+
+    @staticmethod
+    def _extract_values(obj: Any, chunks: List[TextChunk]) -> None:
+        """Extract string values in document order."""
         if isinstance(obj, str):
-            chunks.append(
-                TextChunk(text=obj, offset=0, metadata={"type": "json", "path": path.copy()})
-            )
-        elif isinstance(obj, dict):
-            for key, value in obj.items():
-                JSONParser._extract_values(value, chunks, path + [key])
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                JSONParser._extract_values(item, chunks, path + [i])
+            chunks.append(TextChunk(text=obj, offset=0, metadata={"type": "json", "path": ()}))
+            return
+
+        # Walk with an explicit stack of (path, open iterator) so deeply nested documents
+        # cannot hit the recursion limit. Paths are immutable tuples, so each chunk keeps
+        # the one built on the way down instead of copying a shared list
+        children = JSONParser._children(obj)
+        stack = [((), children)] if children is not None else []
+        while stack:
+            path, entries = stack[-1]
+            for key, value in entries:
+                if isinstance(value, str):
+                    metadata = {"type": "json", "path": path + (key,)}
+                    chunks.append(TextChunk(text=value, offset=0, metadata=metadata))
+                    continue
+                children = JSONParser._children(value)
+                if children is not None:
+                    # Descend now and resume this container's iterator afterwards
+                    stack.append((path + (key,), children))
+                    break
+            else:
+                stack.pop()
 
     @staticmethod
     def reconstruct(original: dict, chunks: List[TextChunk], masked_texts: List[str]) -> dict:
         """Reconstruct JSON with masked values."""
-        result = copy.deepcopy(original)
+        result = JSONParser._copy_structure(original)
 
         for chunk, masked_text in zip(chunks, masked_texts):
             if "path" in chunk.metadata:
@@ -89,7 +114,34 @@ class JSONParser:
         return result
 
     @staticmethod
-    def _set_by_path(obj: Any, path: List[Union[str, int]], value: str) -> None:
+    def _copy_structure(obj: Any) -> Any:
+        """Copy dicts and lists, sharing immutable JSON scalars instead of deep-copying them."""
+        if type(obj) is not dict and type(obj) is not list:
+            return copy.deepcopy(obj)
+
+        # Containers are created empty and filled from a stack, so depth is unbounded
+        root = type(obj)()
+        stack = [(obj, root)]
+        while stack:
+            source, target = stack.pop()
+            is_dict = type(source) is dict
+            for key, value in source.items() if is_dict else enumerate(source):
+                kind = type(value)
+                if kind in _JSON_SCALARS:
+                    copied = value
+                elif kind is dict or kind is list:
+                    copied = kind()
+                    stack.append((value, copied))
+                else:
+                    copied = copy.deepcopy(value)
+                if is_dict:
+                    target[key] = copied
+                else:
+                    target.append(copied)
+        return root
+
+    @staticmethod
+    def _set_by_path(obj: Any, path: Tuple[Union[str, int], ...], value: str) -> None:
         """Set value in nested structure by path."""
         current = obj
         for key in path[:-1]:
@@ -111,24 +163,27 @@ class HTMLParser:
 
         # Extract text between tags
         for match in HTMLParser.TEXT_PATTERN.finditer(html):
-            text = match.group(1).strip()
+            raw = match.group(1)
+            text = raw.strip()
             if text and len(text) > 1:  # Skip whitespace and single chars
                 chunks.append(
                     TextChunk(
                         text=text,
-                        offset=match.start(1),
+                        # Offset of the stripped text, so reconstruct replaces exactly it
+                        offset=match.start(1) + len(raw) - len(raw.lstrip()),
                         metadata={"type": "html", "tag_text": True},
                     )
                 )
 
         # Extract relevant attributes
         for match in HTMLParser.ATTR_PATTERN.finditer(html):
-            attr_value = match.group(1).strip()
+            raw = match.group(1)
+            attr_value = raw.strip()
             if attr_value and len(attr_value) > 2:
                 chunks.append(
                     TextChunk(
                         text=attr_value,
-                        offset=match.start(1),
+                        offset=match.start(1) + len(raw) - len(raw.lstrip()),
                         metadata={"type": "html", "tag_text": False},
                     )
                 )
@@ -138,16 +193,18 @@ class HTMLParser:
     @staticmethod
     def reconstruct(original: str, chunks: List[TextChunk], masked_texts: List[str]) -> str:
         """Reconstruct HTML with masked values."""
-        result = original
-
-        # Sort by offset in reverse order for safe replacement
-        chunk_pairs = list(zip(chunks, masked_texts))
-        chunk_pairs.sort(key=lambda x: x[0].offset, reverse=True)
-
-        # Apply replacements from right to left
-        for chunk, replacement in chunk_pairs:
+        # Stitch the document together left to right in a single join, instead of
+        # re-slicing the whole string once per chunk
+        parts = []
+        cursor = 0
+        for chunk, replacement in sorted(zip(chunks, masked_texts), key=lambda x: x[0].offset):
             start = chunk.offset
-            end = start + len(chunk.text)
-            result = result[:start] + replacement + result[end:]
-
-        return result
+            # Unchanged chunks need no splice; overlapping ones would corrupt the markup
+            if replacement == chunk.text or start < cursor:
+                continue
+            parts.append(original[cursor:start])
+            parts.append(replacement)
+            cursor = start + len(chunk.text)
+        parts.append(original[cursor:])
+
+        return "".join(parts)
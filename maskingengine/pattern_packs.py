@@ -1,12 +1,35 @@
 """Pattern pack loading and management system for MaskingEngine."""
 
+import copy
 import os
 import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
+# LibYAML's C loader parses packs several times faster when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream: Any) -> Any:
+    """Safely parse YAML, using the C loader when PyYAML was built with LibYAML."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str, flags: int = re.IGNORECASE | re.MULTILINE) -> re.Pattern:
+    """Compile a regex pattern once per process and reuse it across packs and detectors."""
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=64)
+def _parse_pack_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a pack file once per process for each version of its contents."""
+    with open(path, "r", encoding="utf-8") as f:
+        return load_yaml(f)
+
 
 @dataclass
 class PatternRule:
@@ -26,7 +49,7 @@ class PatternRule:
             self.compiled_patterns = []
             for pattern in self.patterns:
                 try:
-                    self.compiled_patterns.append(re.compile(pattern, re.IGNORECASE | re.MULTILINE))
+                    self.compiled_patterns.append(compile_pattern(pattern))
                 except re.error as e:
                     print(f"Warning: Invalid regex pattern in {self.name}: {pattern} - {e}")
 
@@ -98,8 +121,10 @@ class PatternPackLoader:
             return None
 
         try:
-            with open(pack_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            # Keyed on mtime and size so edited packs are parsed again. The cached
+            # document is shared, so work on a copy that callers may mutate freely
+            stat = pack_file.stat()
+            data = copy.deepcopy(_parse_pack_file(str(pack_file), stat.st_mtime_ns, stat.st_size))
 
             # Handle new format with meta section
             if "meta" in data:
@@ -211,7 +236,7 @@ class PatternPackLoader:
 
         try:
             with open(pack_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = load_yaml(f)
         except Exception as e:
             return False, [f"Failed to parse YAML: {e}"]
 
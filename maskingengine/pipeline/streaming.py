@@ -1,12 +1,53 @@
 """Streaming masking pipeline for processing large inputs in chunks."""
 
-from typing import Dict, List, Optional, Iterator, Tuple, Any
+from typing import Dict, List, Optional, Iterable, Iterator, Tuple, Any
 import hashlib
+import re
 from dataclasses import dataclass
 
 from ..sanitizer import Sanitizer
 from ..config import Config
 
+# Any <<...>> token the sanitizer may have emitted
+_PLACEHOLDER_PATTERN = re.compile(r"<<[^<>\s]+>>")
+
+
+def _line_chunks(lines: Iterable[str], chunk_size: int, max_length: int) -> Iterator[str]:
+    """Group lines into chunks of about chunk_size characters, none over max_length.
+
+    A line longer than max_length is split, at its last space before the limit
+    where there is one.
+    """
+    chunk_size = min(chunk_size, max_length)
+    parts: List[str] = []
+    size = 0
+    for line in lines:
+        while size + len(line) > max_length:
+            if parts:
+                yield "".join(parts)
+                parts, size = [], 0
+                continue
+            cut = line.rfind(" ", 0, max_length) + 1 or max_length
+            yield line[:cut]
+            line = line[cut:]
+        parts.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield "".join(parts)
+            parts, size = [], 0
+    if parts:
+        yield "".join(parts)
+
+
+def _split_lines(text: str) -> Iterator[str]:
+    """Yield the lines of text with their newlines, splitting on "\n" only."""
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        end = len(text) if end == -1 else end + 1
+        yield text[start:end]
+        start = end
+
 
 @dataclass
 class StreamingChunk:
@@ -49,6 +90,9 @@ class StreamingMaskingSession:
         self.chunk_counter = 0
         self.global_placeholder_counters: Dict[str, int] = {}
         self.seen_pii_hashes: Dict[str, str] = {}  # Maps PII content hash to placeholder
+        # Hash of each (type, content) seen, since the same values recur across chunks.
+        # Kept on the session so the PII is released with it
+        self._pii_hash_memo: Dict[Tuple[str, str], str] = {}
         self.total_detections = 0
 
         # Buffering for cross-chunk patterns
@@ -60,12 +104,17 @@ class StreamingMaskingSession:
         import time
 
         timestamp = str(int(time.time() * 1000))
-        return hashlib.md5(timestamp.encode()).hexdigest()[:8]
+        return hashlib.blake2b(timestamp.encode(), digest_size=4).hexdigest()
 
     def _get_pii_hash(self, content: str, pii_type: str) -> str:
         """Generate a consistent hash for PII content."""
-        combined = f"{self.session_id}:{pii_type}:{content}"
-        return hashlib.md5(combined.encode()).hexdigest()[:6]
+        key = (pii_type, content)
+        content_hash = self._pii_hash_memo.get(key)
+        if content_hash is None:
+            combined = f"{self.session_id}:{pii_type}:{content}"
+            content_hash = hashlib.blake2b(combined.encode(), digest_size=3).hexdigest()
+            self._pii_hash_memo[key] = content_hash
+        return content_hash
 
     def _generate_consistent_placeholder(self, content: str, pii_type: str) -> str:
         """Generate consistent placeholder for the same PII across chunks."""
@@ -144,6 +193,7 @@ class StreamingMaskingSession:
         # Replace placeholders with consistent ones across the session
         detections = []
         placeholder_count = 0
+        replacements: Dict[str, str] = {}
 
         # Extract detections and replace with consistent placeholders
         for placeholder, original_value in mask_map.items():
@@ -158,8 +208,7 @@ class StreamingMaskingSession:
                         original_value, pii_type
                     )
 
-                    # Replace in masked content
-                    masked_content = masked_content.replace(placeholder, consistent_placeholder)
+                    replacements[placeholder] = consistent_placeholder
 
                     # Record detection
                     detections.append(
@@ -172,6 +221,12 @@ class StreamingMaskingSession:
                     )
                     placeholder_count += 1
 
+        # Swap every placeholder in one pass over the masked content
+        if replacements:
+            masked_content = _PLACEHOLDER_PATTERN.sub(
+                lambda m: replacements.get(m.group(0), m.group(0)), masked_content
+            )
+
         # Postprocess chunk for overlap
         final_content, next_overlap = self._postprocess_chunk(
             masked_content, chunk.content, is_first_chunk, chunk.is_final
@@ -258,6 +313,7 @@ class StreamingMaskingSession:
         self.chunk_counter = 0
         self.global_placeholder_counters.clear()
         self.seen_pii_hashes.clear()
+        self._pii_hash_memo.clear()
         self.total_detections = 0
         self.overlap_buffer = ""
         self.session_id = self._generate_session_id()
@@ -298,6 +354,42 @@ class StreamingTextProcessor:
                     break
                 yield chunk
 
+    @staticmethod
+    def from_string_lines(
+        text: str, chunk_size: int = 1 << 16, max_length: int = Config.MAX_TEXT_LENGTH
+    ) -> Iterator[str]:
+        """Create iterator of whole-line chunks from a string.
+
+        Args:
+            text: Input text to chunk
+            chunk_size: Approximate size of each chunk in characters
+            max_length: Largest chunk to yield; longer lines are split
+
+        Yields:
+            String chunks made of complete lines
+        """
+        yield from _line_chunks(_split_lines(text), chunk_size, max_length)
+
+    @staticmethod
+    def from_file_lines(
+        file_path: str, chunk_size: int = 1 << 16, max_length: int = Config.MAX_TEXT_LENGTH
+    ) -> Iterator[str]:
+        """Create iterator of whole-line chunks from a file.
+
+        Unlike ``from_file``, chunks only split a line when it is longer than
+        max_length, so PII on a single line is otherwise seen in full by the detectors.
+
+        Args:
+            file_path: Path to input file
+            chunk_size: Approximate size of each chunk in characters
+            max_length: Largest chunk to yield, normally the sanitizer's MAX_TEXT_LENGTH
+
+        Yields:
+            String chunks made of complete lines
+        """
+        with open(file_path, "r", encoding="utf-8") as f:
+            yield from _line_chunks(f, chunk_size, max_length)
+
     @staticmethod
     def from_stdin(chunk_size: int = 4096) -> Iterator[str]:
         """Create iterator from stdin.
@@ -1,10 +1,19 @@
 """Rehydration module for restoring original PII from masked content."""
 
 import json
+import os
 import re
+import tempfile
+import threading
+from collections import OrderedDict
 from typing import Dict, Union, Any, Optional, List, Tuple, TYPE_CHECKING
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from .sanitizer import Sanitizer
 
@@ -46,22 +55,18 @@ class Rehydrator:
 
     def _rehydrate_text(self, text: str, mask_map: Dict[str, str]) -> str:
         """Rehydrate text content."""
-        result = text
-
-        # Find all placeholders in the text
-        placeholders = self.placeholder_pattern.findall(text)
 
-        for pii_type, hash_value, index in placeholders:
-            placeholder = f"<<{pii_type}_{hash_value}_{index}>>"
-
-            if placeholder in mask_map:
-                original_value = mask_map[placeholder]
-                result = result.replace(placeholder, original_value)
-            else:
+        def restore(match: "re.Match[str]") -> str:
+            placeholder = match.group(0)
+            original_value = mask_map.get(placeholder)
+            if original_value is None:
                 # Optionally raise an error for missing mappings
                 print(f"Warning: No mapping found for placeholder {placeholder}")
+                return placeholder
+            return original_value
 
-        return result
+        # Replace every placeholder in a single left-to-right pass
+        return self.placeholder_pattern.sub(restore, text)
 
     def _rehydrate_json(self, data: Dict, mask_map: Dict[str, str]) -> Dict:
         """Rehydrate JSON/dict content recursively."""
@@ -164,8 +169,14 @@ class Rehydrator:
 class RehydrationStorage:
     """Handles storage and retrieval of mask maps for later rehydration."""
 
+    # Parsed mask maps kept in memory, validated against file mtime and size
+    CACHE_SIZE = 256
+
     def __init__(self, storage_dir: str = "rehydration_storage") -> None:
         """Initialize storage system."""
+        self._cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, str]]]" = OrderedDict()
+        # Storage is shared by concurrent API requests, so the cache needs a lock
+        self._cache_lock = threading.Lock()
         self.storage_dir = Path(storage_dir)
         try:
             self.storage_dir.mkdir(exist_ok=True)
@@ -193,11 +204,20 @@ class RehydrationStorage:
         file_path = self.storage_dir / f"{session_id}.json"
 
         try:
-            with open(file_path, "w") as f:
-                json.dump(mask_map, f, indent=2)
+            # Write to a temp file and rename so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.storage_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(mask_map, f, indent=2)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
         except (IOError, PermissionError, OSError) as e:
             raise IOError(f"Failed to store mask map for session '{session_id}': {e}")
 
+        with self._cache_lock:
+            self._cache.pop(session_id, None)
         return str(file_path)
 
     def load_mask_map(self, session_id: str) -> Optional[Dict[str, str]]:
@@ -212,16 +232,35 @@ class RehydrationStorage:
         """
         file_path = self.storage_dir / f"{session_id}.json"
 
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
+            with self._cache_lock:
+                self._cache.pop(session_id, None)
             return None
 
+        # Reuse the parsed map while the file is unchanged
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._cache_lock:
+            cached = self._cache.get(session_id)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(session_id)
+                return dict(cached[1])
+
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-                return data if isinstance(data, dict) else None
-        except (json.JSONDecodeError, IOError):
+            raw = file_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (ValueError, IOError):
+            return None
+        if not isinstance(data, dict):
             return None
 
+        with self._cache_lock:
+            self._cache[session_id] = (version, data)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return dict(data)
+
     def delete_mask_map(self, session_id: str) -> bool:
         """
         Delete stored mask map.
@@ -233,11 +272,15 @@ class RehydrationStorage:
             True if deleted successfully, False if not found
         """
         file_path = self.storage_dir / f"{session_id}.json"
+        with self._cache_lock:
+            self._cache.pop(session_id, None)
 
-        if file_path.exists():
+        try:
             file_path.unlink()
-            return True
-        return False
+        except FileNotFoundError:
+            # Never stored, or deleted by a concurrent request
+            return False
+        return True
 
     def list_sessions(self) -> List[str]:
         """List all stored session IDs."""
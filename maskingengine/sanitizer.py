@@ -1,12 +1,17 @@
 """Simplified sanitizer class for minimal architecture."""
 
+import json
+import re
 import time
-from typing import Union, Dict, Any, Optional, Tuple
+from typing import Union, Dict, Any, List, Optional, Tuple, Iterable, Iterator
 from .config import Config
-from .parsers import Parser, JSONParser, HTMLParser
+from .parsers import Parser, JSONParser, HTMLParser, TextChunk
 from .detectors import Detector
 from .masker import Masker
 
+# Opening tags that mark a string as HTML, matched case-insensitively
+_HTML_TAG = re.compile(r"<(?:html|body|div|p>|span|a )", re.IGNORECASE | re.ASCII)
+
 
 class Sanitizer:
     """Main sanitizer class with simple synchronous API."""
@@ -17,6 +22,10 @@ class Sanitizer:
         self.detector = Detector(self.config)
         self.masker = Masker(self.config.TYPE_HASHES, self.config)
         self.mask_map: Dict[str, str] = {}  # Store original values for rehydration
+        # Placeholder for each (type, value) masked in the current document
+        self._seen: Dict[Tuple[str, str], str] = {}
+        # Shared by every chunk while sanitize_stream runs, None otherwise
+        self._stream_seen: Optional[Dict[Tuple[str, str], str]] = None
 
     def sanitize(
         self, input_data: Union[str, Dict, Any], format: Optional[str] = None
@@ -29,23 +38,24 @@ class Sanitizer:
             format: Optional format hint ("text", "json", "html", or None for auto-detect)
 
         Returns:
-            Tuple of (sanitized_data, mask_map) where mask_map contains original values for rehydration
+            Tuple of (sanitized_data, mask_map) where mask_map contains original values for rehydration.
+            If masking fails unexpectedly, the input is returned as it was, dict or
+            string, with an empty mask_map
 
         Raises:
             ValueError: If input is too large or invalid
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Validate input size
-            input_str = str(input_data)
-            if len(input_str) > self.config.MAX_TEXT_LENGTH:
-                raise ValueError(
-                    f"Input too large: {len(input_str)} > {self.config.MAX_TEXT_LENGTH}"
-                )
+            input_length = self._input_length(input_data)
+            if input_length > self.config.MAX_TEXT_LENGTH:
+                raise ValueError(f"Input too large: {input_length} > {self.config.MAX_TEXT_LENGTH}")
 
             # Reset mask map for each sanitization
             self.mask_map = {}
+            self._seen = {} if self._stream_seen is None else self._stream_seen
 
             # Parse input based on format
             if format == "json" or (format is None and isinstance(input_data, dict)):
@@ -53,9 +63,9 @@ class Sanitizer:
             elif format == "html" or (
                 format is None and isinstance(input_data, str) and self._is_html(input_data)
             ):
-                result = self._sanitize_html(str(input_data))
+                result = self._sanitize_html(self._as_text(input_data))
             else:
-                result = self._sanitize_text(str(input_data))
+                result = self._sanitize_text(self._as_text(input_data))
 
             return (result, self.mask_map.copy())
 
@@ -64,12 +74,95 @@ class Sanitizer:
             raise
         except Exception as e:
             # Graceful degradation for other errors
-            return (str(input_data), {})  # Return original on error
+            return (input_data, {})  # Return original on error
         finally:
             # Performance monitoring
-            elapsed = (time.time() - start_time) * 1000
-            if elapsed > 100:  # Warn if over 100ms
-                print(f"Warning: Processing took {elapsed:.1f}ms")
+            slow_ms = self.config.SLOW_WARNING_MS
+            if slow_ms:
+                elapsed = (time.perf_counter() - start_time) * 1000
+                if elapsed > slow_ms:
+                    print(f"Warning: Processing took {elapsed:.1f}ms")
+
+    def sanitize_stream(self, chunks: Iterable[str]) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """
+        Sanitize plain text delivered as a sequence of chunks.
+
+        Each chunk is masked as it arrives, so memory use is bounded by the chunk
+        size rather than the whole input. Placeholder indices keep increasing across
+        chunks, and a value repeated in later chunks keeps its first placeholder.
+        Chunks should end on line boundaries so PII is not split between them.
+
+        Args:
+            chunks: Iterable of text chunks
+
+        Yields:
+            Tuples of (sanitized_chunk, mask_map) where mask_map covers that chunk only
+        """
+        self._stream_seen = {}
+        try:
+            for chunk in chunks:
+                yield self.sanitize(chunk, format="text")
+        finally:
+            self._stream_seen = None
+
+    def sanitize_file(
+        self, input_path: str, output_path: str, chunk_size: int = 1 << 16
+    ) -> Dict[str, str]:
+        """
+        Sanitize a plain-text file into another file without loading it whole.
+
+        The input is read in whole-line chunks and each masked chunk is written
+        out before the next one is read, so memory use stays flat for large files.
+        Chunks never exceed MAX_TEXT_LENGTH; longer lines are split to fit.
+
+        Args:
+            input_path: Path to the UTF-8 text file to sanitize
+            output_path: Path the sanitized text is written to
+            chunk_size: Approximate size of each chunk in characters, capped at
+                MAX_TEXT_LENGTH
+
+        Returns:
+            Mask map covering the whole file
+        """
+        from .pipeline.streaming import StreamingTextProcessor
+
+        mask_map: Dict[str, str] = {}
+        chunks = StreamingTextProcessor.from_file_lines(
+            input_path, chunk_size, self.config.MAX_TEXT_LENGTH
+        )
+        with open(output_path, "w", encoding="utf-8") as out:
+            for masked_chunk, chunk_map in self.sanitize_stream(chunks):
+                out.write(masked_chunk)
+                mask_map.update(chunk_map)
+
+        return mask_map
+
+    def sanitize_batch(self, texts: List[str]) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Sanitize several plain-text documents in one pass.
+
+        NER inference runs over all documents in mini-batches instead of one
+        document at a time. Placeholder indices keep increasing across documents.
+
+        Args:
+            texts: List of text strings
+
+        Returns:
+            List of (sanitized_text, mask_map) tuples, one per input text
+
+        Raises:
+            ValueError: If any input is too large
+        """
+        for text in texts:
+            if len(text) > self.config.MAX_TEXT_LENGTH:
+                raise ValueError(f"Input too large: {len(text)} > {self.config.MAX_TEXT_LENGTH}")
+
+        results = []
+        for text, detections in zip(texts, self.detector.detect_all_batch(texts)):
+            mask_map: Dict[str, str] = {}
+            results.append((self.masker.mask(text, detections, mask_map), mask_map))
+
+        return results
 
     def _sanitize_text(self, text: str) -> str:
         """Sanitize plain text."""
@@ -77,14 +170,12 @@ class Sanitizer:
         detections = self.detector.detect_all(text)
 
         # Apply masking
-        return self.masker.mask(text, detections, self.mask_map)
+        return self.masker.mask(text, detections, self.mask_map, self._seen)
 
     def _sanitize_json(self, data: Union[str, dict]) -> Union[dict, str]:
         """Sanitize JSON data while preserving structure."""
         # Parse JSON if string
         if isinstance(data, str):
-            import json
-
             try:
                 parsed_data = json.loads(data)
             except json.JSONDecodeError as e:
@@ -98,11 +189,7 @@ class Sanitizer:
         chunks = Parser.parse(parsed_data)
 
         # Process each chunk
-        masked_texts = []
-        for chunk in chunks:
-            detections = self.detector.detect_all(chunk.text)
-            masked_text = self.masker.mask(chunk.text, detections, self.mask_map)
-            masked_texts.append(masked_text)
+        masked_texts = self._mask_chunks(chunks)
 
         # Reconstruct JSON
         return JSONParser.reconstruct(parsed_data, chunks, masked_texts)
@@ -113,21 +200,37 @@ class Sanitizer:
         chunks = HTMLParser.parse(html)
 
         # Process each chunk
-        masked_texts = []
-        for chunk in chunks:
-            detections = self.detector.detect_all(chunk.text)
-            masked_text = self.masker.mask(chunk.text, detections, self.mask_map)
-            masked_texts.append(masked_text)
+        masked_texts = self._mask_chunks(chunks)
 
         # Reconstruct HTML
         return HTMLParser.reconstruct(html, chunks, masked_texts)
 
+    def _mask_chunks(self, chunks: List[TextChunk]) -> List[str]:
+        """Mask each chunk's text separately, batching NER inference across the chunks."""
+        texts = [chunk.text for chunk in chunks]
+        return [
+            self.masker.mask(text, detections, self.mask_map, self._seen)
+            for text, detections in zip(texts, self.detector.detect_all_batch(texts))
+        ]
+
+    @staticmethod
+    def _input_length(input_data: Any) -> int:
+        """Size of the input in characters, as JSON for anything but a string."""
+        if isinstance(input_data, str):
+            return len(input_data)
+        try:
+            return len(json.dumps(input_data, ensure_ascii=False, default=str))
+        except RecursionError:
+            # Too deep to serialize recursively; count the string values, which the
+            # parser walks iteratively
+            return sum(len(chunk.text) for chunk in JSONParser.parse(input_data))
+
+    @staticmethod
+    def _as_text(input_data: Any) -> str:
+        """Input as a string for the text and HTML paths."""
+        return input_data if isinstance(input_data, str) else str(input_data)
+
     def _is_html(self, text: str) -> bool:
         """Quick heuristic to detect HTML content."""
-        return (
-            "<" in text[:100]
-            and ">" in text[:100]
-            and any(
-                tag in text.lower() for tag in ["<html", "<body", "<div", "<p>", "<span", "<a "]
-            )
-        )
+        # One scan for any of the tags, without lowercasing a copy of the text per tag
+        return "<" in text[:100] and ">" in text[:100] and _HTML_TAG.search(text) is not None
@@ -0,0 +1,29 @@
+"""Gunicorn configuration for running the MaskingEngine API with pre-forked workers.
+
+The app and the default NER model are loaded once in the master process and
+shared copy-on-write by the forked workers, instead of each worker loading
+its own copy.
+
+Usage:
+    pip install gunicorn
+    gunicorn -c scripts/gunicorn_conf.py maskingengine.api.main:app
+"""
+
+import os
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '8000')}"
+workers = int(os.getenv("API_WORKERS", str(os.cpu_count() or 1)))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+keepalive = 75
+
+# Keep worker heartbeat files off disk where available
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+
+def when_ready(server):
+    """Load the NER model in the master before workers are forked."""
+    from maskingengine.api.main import preload_ner_model
+
+    preload_ner_model()
@@ -3,13 +3,24 @@
 
 import os
 import uvicorn
-from maskingengine.api.main import app, API_HOST, API_PORT
+from maskingengine.api.main import API_HOST, API_PORT, API_WORKERS
 
 if __name__ == "__main__":
     print(f"🚀 Starting MaskingEngine API on http://{API_HOST}:{API_PORT}")
     print(f"📚 API Documentation: http://{API_HOST}:{API_PORT}/docs")
     print(f"🔍 ReDoc Documentation: http://{API_HOST}:{API_PORT}/redoc")
 
+    # Auto-reload is for development only: it runs a file watcher and a single worker
+    reload = os.getenv("API_RELOAD", "false").lower() == "true"
+
+    # Reload mode is single-process; otherwise run one worker per core
     uvicorn.run(
-        app, host=API_HOST, port=API_PORT, reload=os.getenv("API_RELOAD", "true").lower() == "true"
+        "maskingengine.api.main:app",
+        host=API_HOST,
+        port=API_PORT,
+        reload=reload,
+        workers=None if reload else API_WORKERS,
+        loop="auto",
+        http="auto",
+        log_level=os.getenv("API_LOG_LEVEL", "warning"),
     )
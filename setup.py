@@ -69,7 +69,17 @@ setup(
         ],
         "api": [
             "fastapi>=0.68.0",
-            "uvicorn>=0.15.0",
+            "uvicorn[standard]>=0.15.0",
+            "orjson>=3.6.0",
+        ],
+        "re2": [
+            "google-re2>=1.0",
+        ],
+        "hyperscan": [
+            "hyperscan>=0.4",
+        ],
+        "onnx": [
+            "optimum[onnxruntime]>=1.12.0",
         ],
         "minimal": [
             "pyyaml>=6.0",
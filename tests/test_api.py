@@ -34,6 +34,14 @@ class TestAPIEndpoints:
         assert "version" in data
         assert "ner_enabled" in data
 
+    def test_health_endpoint_caches_self_test(self, client):
+        """Test that repeated health probes reuse the cached self-test result."""
+        client.get("/health")
+        with patch("maskingengine.api.main.Sanitizer") as mock_sanitizer:
+            response = client.get("/health")
+        assert response.status_code == 200
+        mock_sanitizer.assert_not_called()
+
     def test_sanitize_endpoint(self, client):
         """Test sanitize endpoint."""
         payload = {"content": "Contact john@example.com or call 555-123-4567", "regex_only": True}
@@ -47,6 +55,114 @@ class TestAPIEndpoints:
         assert data["sanitized_content"] != payload["content"]
         assert len(data["mask_map"]) > 0
 
+    def test_sanitize_json_with_big_integer(self, client):
+        """Test JSON content with integers wider than 64 bits is still returned."""
+        content = {"id": 2**70, "email": "big@example.com"}
+        response = client.post("/sanitize", json={"content": content, "regex_only": True})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["sanitized_content"]["id"] == 2**70
+        assert data["sanitized_content"]["email"].startswith("<<EMAIL_")
+
+    def test_sanitize_rejects_unlisted_ner_model(self, client):
+        """Test requests can only select NER models from the configured allowlist."""
+        payload = {"content": "Hello", "ner_model": "someone/arbitrary-repo"}
+        for path in ("/sanitize", "/sanitize/stream"):
+            response = client.post(path, json=payload)
+            assert response.status_code == 400
+            assert "NER model not allowed" in response.json()["detail"]
+
+        session = dict(payload, session_id="not-allowed")
+        assert client.post("/session/sanitize", json=session).status_code == 400
+
+    def test_sanitize_reuses_config_for_same_options(self):
+        """Test that identical request options share one Config instance."""
+        from maskingengine.api.main import SanitizeRequest, get_request_config
+
+        first = SanitizeRequest(content="a", regex_only=True, whitelist=["x", "y"])
+        second = SanitizeRequest(content="b", regex_only=True, whitelist=["y", "x"])
+        other = SanitizeRequest(content="a", regex_only=False)
+
+        assert get_request_config(first) is get_request_config(second)
+        assert get_request_config(first) is not get_request_config(other)
+
+    def test_sanitize_caches_identical_requests(self, client):
+        """Test that repeated identical requests are served from the opt-in result cache."""
+        from maskingengine.api import main
+
+        assert not main.sanitize_cache.enabled  # Off unless SANITIZE_CACHE_SIZE is set
+
+        cache = main.SanitizeResultCache(16)
+        with patch.object(main, "sanitize_cache", cache):
+            payload = {"content": "Cache me: cached@example.com", "regex_only": True}
+            first = client.post("/sanitize", json=payload).json()
+            with patch("maskingengine.api.main.Sanitizer") as mock_sanitizer:
+                second = client.post("/sanitize", json=payload).json()
+            mock_sanitizer.assert_not_called()
+            assert second == first
+
+            # Different options must not hit the same entry
+            payload["whitelist"] = ["cached@example.com"]
+            third = client.post("/sanitize", json=payload).json()
+            assert third["sanitized_content"] == payload["content"]
+
+            # Nor the same data with its keys in another order
+            a = {"a": "a@example.com", "b": "b@example.com"}
+            b = {"b": "b@example.com", "a": "a@example.com"}
+            for content in (a, b):
+                result = client.post("/sanitize", json={"content": content, "regex_only": True})
+                assert list(result.json()["sanitized_content"]) == list(content)
+
+        # Expired entries are dropped
+        cache = main.SanitizeResultCache(16, ttl=-1)
+        cache.put(("key",), ("masked", {}))
+        assert cache.get(("key",)) is None
+
+    def test_sanitize_stream_endpoint(self, client):
+        """Test streaming sanitization emits masked chunks as Server-Sent Events."""
+        from maskingengine.api import main
+
+        content = "".join(f"Line {i}: user{i}@example.com\n" for i in range(20))
+        with patch.object(main, "STREAM_CHUNK_SIZE", 100):
+            response = client.post(
+                "/sanitize/stream", json={"content": content, "regex_only": True}
+            )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+        mask_events = [json.loads(data[6:]) for name, data in events if name == "event: mask"]
+        assert len(mask_events) > 1
+        assert events[-1][0] == "event: done"
+        assert json.loads(events[-1][1][6:])["detection_count"] == 20
+
+        masked = "".join(event["chunk"] for event in mask_events)
+        assert "@example.com" not in masked
+        assert len(masked.splitlines()) == 20
+
+        # Structured content is rejected
+        response = client.post("/sanitize/stream", json={"content": {"email": "a@b.com"}})
+        assert response.status_code == 400
+
+    def test_sanitize_stream_splits_long_lines(self, client):
+        """Test a line longer than MAX_TEXT_LENGTH is split and failures end with an error event."""
+        from maskingengine import Config
+
+        content = "word " * 300 + "long@example.com\nshort@example.com\n"
+        with patch.object(Config, "MAX_TEXT_LENGTH", 400):
+            response = client.post(
+                "/sanitize/stream", json={"content": content, "regex_only": True}
+            )
+        events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+        chunks = [json.loads(data[6:])["chunk"] for name, data in events if name == "event: mask"]
+        assert all(len(chunk) <= 400 for chunk in chunks)
+        assert "@example.com" not in "".join(chunks)
+        assert events[-1][0] == "event: done"
+
+        with patch("maskingengine.api.main.Sanitizer.sanitize_stream", side_effect=RuntimeError):
+            response = client.post("/sanitize/stream", json={"content": "x", "regex_only": True})
+        assert response.text.startswith("event: error")
+
     def test_sanitize_with_whitelist(self, client):
         """Test sanitize with whitelist."""
         payload = {
@@ -13,6 +13,23 @@ class TestBasicFunctionality:
         assert Config is not None
         assert Rehydrator is not None
 
+    def test_import_is_lazy(self):
+        """Test importing the package defers loading the detection modules."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, maskingengine\n"
+            "print('maskingengine.detectors' in sys.modules)\n"
+            "print(maskingengine.Sanitizer.__module__)\n"
+            "import maskingengine.cli.main\n"
+            "print('jsonschema' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "maskingengine.sanitizer", "False"]
+
     def test_regex_email_detection(self):
         """Test email detection with regex-only mode."""
         config = Config(regex_only=True)
@@ -51,6 +68,124 @@ class TestBasicFunctionality:
         assert "<<PHONE_" in masked
         assert len(mask_map) == 2
 
+    def test_repeated_pii_shares_placeholder(self):
+        """Test repeated values in one text are masked with the same placeholder."""
+        sanitizer = Sanitizer(Config(regex_only=True))
+
+        text = "john@example.com wrote to jane@example.com, then john@example.com again"
+        masked, mask_map = sanitizer.sanitize(text)
+
+        assert len(mask_map) == 2
+        assert masked.count("<<EMAIL_") == 3
+        assert Rehydrator().rehydrate(masked, mask_map) == text
+
+    def test_repeated_pii_shares_placeholder_across_chunks(self):
+        """Test a value repeated across JSON fields or stream chunks keeps one placeholder."""
+        sanitizer = Sanitizer(Config(regex_only=True))
+
+        data = {"from": "a@example.com", "cc": ["a@example.com", "b@example.com"]}
+        masked, mask_map = sanitizer.sanitize(data)
+        assert masked["from"] == masked["cc"][0] != masked["cc"][1]
+        assert len(mask_map) == 2
+
+        chunks = ["From a@example.com\n", "Reply to a@example.com\n"]
+        (first, first_map), (second, second_map) = sanitizer.sanitize_stream(chunks)
+        assert first_map == second_map
+        assert first.split()[-1] == second.split()[-1]
+
+        # Separate calls are separate documents
+        assert sanitizer.sanitize("a@example.com")[0] != masked["from"]
+
+    def test_json_sanitize_leaves_input_untouched(self):
+        """Test JSON sanitizing masks nested strings in a copy of the document."""
+        data = {"users": [{"email": "a@example.com", "age": 30, "tags": ["555-123-4567"]}]}
+        masked, mask_map = Sanitizer(Config(regex_only=True)).sanitize(data, format="json")
+
+        assert data["users"][0]["email"] == "a@example.com"
+        assert masked["users"][0]["email"].startswith("<<EMAIL_")
+        assert masked["users"][0]["tags"][0].startswith("<<PHONE_")
+        assert masked["users"][0]["age"] == 30
+        assert masked["users"] is not data["users"]
+        assert Rehydrator().rehydrate(masked, mask_map) == data
+
+    def test_json_parser_handles_deep_nesting(self):
+        """Test JSON extraction and reconstruction do not recurse per nesting level."""
+        import sys
+        from maskingengine.parsers import JSONParser
+
+        data = node = {}
+        for _ in range(sys.getrecursionlimit() + 100):
+            node["child"] = [{}]
+            node = node["child"][0]
+        node["email"] = "a@example.com"
+
+        chunks = JSONParser.parse(data)
+        assert [chunk.text for chunk in chunks] == ["a@example.com"]
+
+        masked = JSONParser.reconstruct(data, chunks, ["<<EMAIL_7A9B2C_1>>"])
+        assert node["email"] == "a@example.com"
+        for key in chunks[0].metadata["path"]:
+            masked = masked[key]
+        assert masked == "<<EMAIL_7A9B2C_1>>"
+
+    def test_sanitize_handles_deeply_nested_dict(self):
+        """Test size checks and masking work for dicts nested past the recursion limit."""
+        import sys
+
+        data = node = {}
+        for _ in range(sys.getrecursionlimit() + 100):
+            node["child"] = {}
+            node = node["child"]
+        node["email"] = "a@example.com"
+
+        masked, mask_map = Sanitizer(Config(regex_only=True)).sanitize(data)
+
+        assert list(mask_map.values()) == ["a@example.com"]
+        while "child" in masked:
+            masked = masked["child"]
+        assert masked["email"].startswith("<<EMAIL_")
+
+    def test_sanitize_error_returns_input_unchanged(self):
+        """Test unexpected masking errors hand back the original input with its type."""
+        from unittest.mock import patch
+
+        sanitizer = Sanitizer(Config(regex_only=True))
+        data = {"email": "a@example.com"}
+        with patch.object(sanitizer, "_sanitize_json", side_effect=RuntimeError("boom")):
+            assert sanitizer.sanitize(data) == (data, {})
+        with patch.object(sanitizer, "_sanitize_text", side_effect=RuntimeError("boom")):
+            assert sanitizer.sanitize("a@example.com") == ("a@example.com", {})
+
+    def test_html_masks_text_with_surrounding_whitespace(self):
+        """Test HTML text and attributes are masked in place around their whitespace."""
+        html = '<p>\n  Email john@example.com </p><a title=" call 555-123-4567">x</a>'
+        masked, mask_map = Sanitizer(Config(regex_only=True)).sanitize(html, format="html")
+
+        assert masked.startswith("<p>\n  Email <<EMAIL_")
+        assert 'title=" call <<PHONE_' in masked
+        assert Rehydrator().rehydrate(masked, mask_map) == html
+
+    def test_html_sniffing_is_case_insensitive(self):
+        """Test auto-detection recognizes HTML tags in any case anywhere in the text."""
+        sanitizer = Sanitizer(Config(regex_only=True))
+        assert sanitizer._is_html("<b>Note</b> " + "x" * 500 + "<DIV>a@example.com</DIV>")
+        assert sanitizer._is_html("<P>Hi</P>")
+        assert not sanitizer._is_html("<b>bold</b> and 1 < 2 > 0 <pre>")
+
+    def test_slow_call_warning_threshold(self, capsys):
+        """Test slow sanitize calls are reported unless the warning is disabled."""
+        from unittest.mock import patch
+
+        config = Config(regex_only=True)
+        with patch("time.perf_counter", side_effect=[0.0, 0.5]):
+            Sanitizer(config).sanitize("no pii here")
+        assert "Warning: Processing took 500.0ms" in capsys.readouterr().out
+
+        config.SLOW_WARNING_MS = 0
+        with patch("time.perf_counter", side_effect=[0.0, 0.5]):
+            Sanitizer(config).sanitize("no pii here")
+        assert capsys.readouterr().out == ""
+
     def test_rehydration(self):
         """Test basic rehydration functionality."""
         config = Config(regex_only=True)
@@ -63,6 +198,128 @@ class TestBasicFunctionality:
 
         assert rehydrated == original
 
+    def test_rehydration_single_pass(self):
+        """Test restored values are not themselves treated as placeholders."""
+        rehydrator = Rehydrator()
+        mask_map = {
+            "<<EMAIL_7A9B2C_1>>": "literal <<EMAIL_7A9B2C_2>>",
+            "<<EMAIL_7A9B2C_2>>": "b@example.com",
+        }
+
+        rehydrated = rehydrator.rehydrate("<<EMAIL_7A9B2C_1>> / <<EMAIL_7A9B2C_2>>", mask_map)
+
+        assert rehydrated == "literal <<EMAIL_7A9B2C_2>> / b@example.com"
+
+    def test_sanitize_file_roundtrip(self, tmp_path):
+        """Test a file sanitized in small chunks rehydrates back to the original."""
+        original = "".join(f"Row {i}: user{i}@example.com, 555-123-45{i:02d}\n" for i in range(40))
+        input_path = tmp_path / "input.txt"
+        output_path = tmp_path / "output.txt"
+        input_path.write_text(original)
+
+        sanitizer = Sanitizer(Config(regex_only=True))
+        mask_map = sanitizer.sanitize_file(str(input_path), str(output_path), chunk_size=100)
+
+        masked = output_path.read_text()
+        assert "@example.com" not in masked
+        assert len(mask_map) == 80
+        assert Rehydrator().rehydrate(masked, mask_map) == original
+
+    def test_sanitize_file_larger_than_max_text_length(self, tmp_path):
+        """Test multi-MB files with over-long lines stay within the configured size limit."""
+        config = Config(regex_only=True)
+        config.MAX_TEXT_LENGTH = 20000
+        long_line = "word " * config.MAX_TEXT_LENGTH + "long@example.com\n"
+        original = "".join(f"Row {i}: user{i}@example.com\n" for i in range(60000)) + long_line
+        input_path = tmp_path / "input.txt"
+        output_path = tmp_path / "output.txt"
+        input_path.write_text(original)
+        assert input_path.stat().st_size > 1 << 20
+
+        mask_map = Sanitizer(config).sanitize_file(str(input_path), str(output_path))
+
+        masked = output_path.read_text()
+        assert "@example.com" not in masked
+        assert len(mask_map) == 60001
+        assert Rehydrator().rehydrate(masked, mask_map) == original
+
+    def test_rehydration_storage_roundtrip(self, tmp_path):
+        """Test stored mask maps reload, pick up rewrites and disappear on delete."""
+        from maskingengine import RehydrationStorage
+
+        storage = RehydrationStorage(str(tmp_path))
+        storage.store_mask_map("s1", {"<<EMAIL_7A9B2C_1>>": "a@example.com"})
+        assert storage.load_mask_map("s1") == {"<<EMAIL_7A9B2C_1>>": "a@example.com"}
+
+        # A second instance (e.g. another worker) overwrites the session
+        RehydrationStorage(str(tmp_path)).store_mask_map(
+            "s1", {"<<EMAIL_7A9B2C_1>>": "changed@example.com"}
+        )
+        assert storage.load_mask_map("s1") == {"<<EMAIL_7A9B2C_1>>": "changed@example.com"}
+        assert storage.list_sessions() == ["s1"]
+
+        assert storage.delete_mask_map("s1") is True
+        assert storage.load_mask_map("s1") is None
+
+    def test_rehydration_storage_concurrent_access(self, tmp_path):
+        """Test concurrent stores, loads and deletes do not corrupt the shared cache."""
+        import threading
+        from maskingengine import RehydrationStorage
+
+        storage = RehydrationStorage(str(tmp_path))
+        storage.CACHE_SIZE = 2
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(200):
+                    session = f"s{i % 4}"
+                    storage.store_mask_map(session, {"<<EMAIL_7A9B2C_1>>": f"{n}@example.com"})
+                    storage.load_mask_map(session)
+                    storage.delete_mask_map(f"s{(i + n) % 4}")
+            except Exception as e:  # pragma: no cover - only on failure
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+    def test_pattern_pack_reloads_after_edit(self, tmp_path):
+        """Test parsed pattern packs are reused until the pack file changes."""
+        from maskingengine.pattern_packs import PatternPackLoader
+
+        pack_file = tmp_path / "custom.yaml"
+        rule = "  - name: TICKET\n    description: Ticket\n    patterns:\n      - '{}'\n"
+        pack_file.write_text("name: custom\npatterns:\n" + rule.format(r"\bTK-\d{4}\b"))
+        first = PatternPackLoader(str(tmp_path)).load_pack("custom")
+        assert PatternPackLoader(str(tmp_path)).load_pack("custom").patterns == first.patterns
+
+        pack_file.write_text("name: custom\npatterns:\n" + rule.format(r"\bTICKET-\d{6}\b"))
+        edited = PatternPackLoader(str(tmp_path)).load_pack("custom")
+        assert edited.patterns[0].patterns == [r"\bTICKET-\d{6}\b"]
+
+    def test_pattern_pack_cache_is_not_shared_mutably(self):
+        """Test mutating one config's patterns does not leak into later configs."""
+        first = Config(regex_only=True)
+        original = list(first.PATTERNS["EMAIL"])
+        first.PATTERNS["EMAIL"].append(r"\bleaked\b")
+
+        assert Config(regex_only=True).PATTERNS["EMAIL"] == original
+
+    def test_luhn_check(self):
+        """Test the Luhn check ignores separators and accepts any script's digits."""
+        from maskingengine.detectors import RegexDetector
+
+        detector = RegexDetector(Config(regex_only=True))
+        assert detector._luhn_check("4111 1111 1111 1111")
+        assert detector._luhn_check("3782-822463-10005")
+        assert not detector._luhn_check("4111-1111-1111-1112")
+        assert not detector._luhn_check("411111111111")  # Too short
+        assert detector._luhn_check("٤١١١١١١١١١١١١١١١")  # Arabic-Indic digits
+
     def test_no_pii_text(self):
         """Test text with no PII remains unchanged."""
         config = Config(regex_only=True)
@@ -77,6 +77,49 @@ class TestCLICommands:
             Path(input_file).unlink()
             Path(output_file).unlink()
 
+    def test_mask_command_streams_text_file(self):
+        """Test mask command streaming a text file larger than MAX_TEXT_LENGTH."""
+        from maskingengine import Config
+
+        lines = [f"Line {i}: contact user{i}@example.com\n" for i in range(30000)]
+        # One line alone is over the limit and has to be split
+        long_line = "word " * (Config.MAX_TEXT_LENGTH // 5) + "last@example.com\n"
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as input_f:
+            input_f.writelines(lines)
+            input_f.write(long_line)
+            input_file = input_f.name
+        assert Path(input_file).stat().st_size > 2 * Config.MAX_TEXT_LENGTH
+
+        try:
+            result = self.runner.invoke(cli, ["mask", input_file, "-f", "text", "--regex-only"])
+            assert result.exit_code == 0, result.output
+            assert "Detected 30001 PII entities" in result.output
+
+            assert "@example.com" not in result.output
+            assert "word word" in result.output
+            # Placeholder indices keep increasing across chunks
+            masked_lines = [line for line in result.output.splitlines() if line.startswith("Line")]
+            assert len(set(masked_lines)) == 30000
+        finally:
+            Path(input_file).unlink()
+
+    def test_mask_command_batch_directory(self):
+        """Test mask command masking every text file in a directory."""
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as out_dir:
+            for i in range(3):
+                Path(input_dir, f"doc{i}.txt").write_text(f"Email user{i}@example.com")
+
+            result = self.runner.invoke(
+                cli, ["mask", "--batch", input_dir, "-o", out_dir, "--regex-only"]
+            )
+            assert result.exit_code == 0
+            assert "Sanitized 3 files" in result.output
+
+            for i in range(3):
+                masked = Path(out_dir, f"doc{i}.sanitized.txt").read_text()
+                assert "<<EMAIL_" in masked
+                assert f"user{i}@example.com" not in masked
+
     def test_mask_command_with_whitelist(self):
         """Test mask command with whitelist."""
         test_content = "Email support@company.com or personal@example.com"
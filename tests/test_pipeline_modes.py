@@ -1,5 +1,11 @@
 """Test regex-only vs full pipeline modes."""
 
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
 from maskingengine import Sanitizer, Config
 
 
@@ -24,6 +30,21 @@ class TestPipelineModes:
         assert config.NER_ENABLED is False
         assert sanitizer.detector.ner_detector is None
 
+    def test_regex_only_mode_skips_ml_imports(self):
+        """Test regex-only sanitizing never imports the NER dependencies."""
+        import subprocess
+
+        code = (
+            "import sys\n"
+            "from maskingengine import Sanitizer, Config\n"
+            "Sanitizer(Config(regex_only=True)).sanitize('a@example.com')\n"
+            "print(sorted({'torch', 'transformers', 'optimum'} & set(sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
     def test_full_pipeline_mode(self):
         """Test that full pipeline mode uses both regex and NER."""
         config = Config(regex_only=False)
@@ -55,6 +76,344 @@ class TestPipelineModes:
         config_full = Config(regex_only=False)
         assert config_full.NER_ENABLED is True
 
+    def test_config_ner_model_options(self):
+        """Test Config routes NER model and quantization options to the detector."""
+        config_default = Config()
+        assert config_default.NER_MODEL_PATH == Config.NER_MODEL_PATH
+        assert config_default.NER_QUANTIZE is False
+
+        config = Config(ner_model="local/pii-model", ner_quantize=True)
+        assert config.NER_MODEL_PATH == "local/pii-model"
+        assert config.NER_QUANTIZE is True
+        assert Sanitizer(config).detector.ner_detector.model_path == "local/pii-model"
+
+        assert Config().NER_BACKEND == "torch"
+        assert Config(ner_backend="onnx").NER_BACKEND == "onnx"
+        with pytest.raises(ValueError):
+            Config(ner_backend="tensorrt")
+
+    def test_ner_model_loaded_once_per_process(self):
+        """Test detectors for the same model share one loaded copy."""
+        from maskingengine import detectors
+
+        transformers = MagicMock()
+        with patch.dict(sys.modules, {"transformers": transformers}), patch.dict(
+            detectors._ner_models, clear=True
+        ):
+            first = Sanitizer(Config(ner_model="shared/model")).detector.ner_detector
+            second = Sanitizer(Config(ner_model="shared/model")).detector.ner_detector
+            assert first.model is second.model
+
+        loader = transformers.AutoModelForTokenClassification.from_pretrained
+        loader.assert_called_once_with("shared/model")
+
+    def test_ner_model_load_failure_is_retried(self):
+        """Test a failed NER model load is not cached, so a later call loads the model."""
+        from maskingengine import detectors
+
+        transformers = MagicMock()
+        transformers.AutoTokenizer.from_pretrained.side_effect = [OSError("offline"), MagicMock()]
+        with patch.dict(sys.modules, {"transformers": transformers}), patch.dict(
+            detectors._ner_models, clear=True
+        ):
+            assert detectors.load_ner_model("flaky/model") == (None, None)
+            tokenizer, model = detectors.load_ner_model("flaky/model")
+            assert model is not None
+            assert detectors.load_ner_model("flaky/model") == (tokenizer, model)
+
+        assert transformers.AutoTokenizer.from_pretrained.call_count == 2
+
+    def test_ner_model_loads_do_not_block_other_models(self):
+        """Test a slow NER model load does not hold up loading a different model."""
+        import threading
+        from maskingengine import detectors
+
+        release = threading.Event()
+        transformers = MagicMock()
+
+        def from_pretrained(path):
+            if path == "slow/model":
+                assert release.wait(5)
+            return MagicMock()
+
+        transformers.AutoTokenizer.from_pretrained.side_effect = from_pretrained
+        with patch.dict(sys.modules, {"transformers": transformers}), patch.dict(
+            detectors._ner_models, clear=True
+        ):
+            slow = threading.Thread(target=detectors.load_ner_model, args=("slow/model",))
+            fast = threading.Thread(target=detectors.load_ner_model, args=("fast/model",))
+            slow.start()
+            fast.start()
+            fast.join(2)
+            loaded_first = ("fast/model", False, "torch") in detectors._ner_models
+            release.set()
+            slow.join()
+            fast.join()
+
+        assert loaded_first
+
+    def test_ner_quick_filter_needs_capitalized_word(self):
+        """Test NER only runs on text with a capitalized word at a word boundary."""
+        from maskingengine.detectors import NERDetector
+
+        detector = NERDetector()
+        assert detector._has_potential_entities("Meet John at noon")
+        assert detector._has_potential_entities("(Berlin)")
+        assert not detector._has_potential_entities("an iPhone and a macBook, 555-123-4567")
+        assert not detector._has_potential_entities("ALL CAPS ONLY")
+
+    def test_ner_pipeline_built_once_with_long_text_windows(self):
+        """Test NER reuses one pipeline per model and windows texts longer than the model."""
+        from maskingengine import detectors
+
+        transformers, torch = MagicMock(), MagicMock()
+        torch.cuda.is_available.return_value = False
+        ner = transformers.pipeline.return_value
+        ner.return_value = [
+            {"entity_group": "PER", "score": 0.99, "word": "John Smith", "start": 8, "end": 18}
+        ]
+        modules = {"transformers": transformers, "torch": torch}
+        with patch.dict(sys.modules, modules), patch.dict(
+            detectors._ner_models, clear=True
+        ), patch.dict(detectors._ner_pipelines, clear=True):
+            detector = Sanitizer(Config(ner_model="windowed/model")).detector.ner_detector
+            text = "Contact John Smith in Berlin about the contract"
+            assert detector.detect(text)[0][1] == "John Smith"
+            assert detector.detect(text)[0][1] == "John Smith"
+
+        transformers.pipeline.assert_called_once()
+        assert transformers.pipeline.call_args.kwargs["stride"] == 128
+        # Inference runs in eval mode without autograd tracking
+        model = transformers.AutoModelForTokenClassification.from_pretrained.return_value
+        model.eval.assert_called_once()
+        assert torch.inference_mode.call_count == 2
+
+    def test_quantized_ner_pipeline_stays_on_cpu(self):
+        """Test an int8-quantized model is not sent to the GPU, where it cannot run."""
+        from maskingengine import detectors
+
+        transformers, torch = MagicMock(), MagicMock()
+        torch.cuda.is_available.return_value = True
+        modules = {"transformers": transformers, "torch": torch}
+        with patch.dict(sys.modules, modules), patch.dict(
+            detectors._ner_models, clear=True
+        ), patch.dict(detectors._ner_pipelines, clear=True):
+            detectors.get_ner_pipeline("gpu/model", quantize=True)
+            assert transformers.pipeline.call_args.kwargs["device"] == -1
+            detectors.get_ner_pipeline("gpu/model")
+            assert transformers.pipeline.call_args.kwargs["device"] == 0
+
+    def test_ner_runs_alongside_regex_scan(self):
+        """Test NER inference runs on a worker thread and its detections are merged."""
+        import threading
+        from maskingengine import detectors
+
+        transformers, torch = MagicMock(), MagicMock()
+        torch.cuda.is_available.return_value = False
+        threads = []
+
+        def ner(text):
+            threads.append(threading.current_thread().name)
+            return [{"entity_group": "PER", "score": 0.99, "word": "John", "start": 5, "end": 9}]
+
+        transformers.pipeline.return_value.side_effect = ner
+        modules = {"transformers": transformers, "torch": torch}
+        with patch.dict(sys.modules, modules), patch.dict(
+            detectors._ner_models, clear=True
+        ), patch.dict(detectors._ner_pipelines, clear=True):
+            sanitizer = Sanitizer(Config(ner_model="threaded/model"))
+            masked, _ = sanitizer.sanitize("Mail John at john@example.com")
+            assert "John" not in masked and "<<EMAIL_" in masked
+            # No NER work for text without capitalized words
+            sanitizer.sanitize("mail john@example.com")
+
+        assert len(threads) == 1 and threads[0].startswith("maskingengine-ner")
+
+    def test_json_values_share_one_ner_batch(self):
+        """Test JSON string values are masked separately with one NER call on distinct values."""
+        from maskingengine import detectors
+
+        transformers, torch = MagicMock(), MagicMock()
+        torch.cuda.is_available.return_value = False
+        ner = transformers.pipeline.return_value
+        ner.return_value = [
+            [],
+            [{"entity_group": "PER", "score": 0.9, "word": "Jane", "start": 0, "end": 4}],
+        ]
+        modules = {"transformers": transformers, "torch": torch}
+        with patch.dict(sys.modules, modules), patch.dict(
+            detectors._ner_models, clear=True
+        ), patch.dict(detectors._ner_pipelines, clear=True):
+            sanitizer = Sanitizer(Config(ner_model="batched/model"))
+            data = {
+                "note": "Line one\nMail a@example.com",
+                "people": ["Jane is here", "Jane is here"],
+            }
+            masked, _ = sanitizer.sanitize(data)
+
+        ner.assert_called_once()
+        assert ner.call_args.args[0] == ["Line one\nMail a@example.com", "Jane is here"]
+        assert masked["note"].startswith("Line one\nMail <<EMAIL_")
+        assert not any(person.startswith("Jane") for person in masked["people"])
+
+    def test_onnx_backend_quantizes_to_int8(self):
+        """Test quantize with the ONNX backend loads an int8-quantized ONNX model."""
+        from maskingengine import detectors
+
+        optimum = MagicMock()
+        modules = {
+            "transformers": MagicMock(),
+            "optimum": optimum,
+            "optimum.onnxruntime": optimum.onnxruntime,
+            "optimum.onnxruntime.configuration": optimum.onnxruntime.configuration,
+        }
+        with patch.dict(sys.modules, modules), patch.dict(detectors._ner_models, clear=True):
+            config = Config(ner_model="onnx/model", ner_quantize=True, ner_backend="onnx")
+            model = Sanitizer(config).detector.ner_detector.model
+
+        ort_model = optimum.onnxruntime.ORTModelForTokenClassification
+        quantizer = optimum.onnxruntime.ORTQuantizer.from_pretrained
+        quantizer.assert_called_once_with(ort_model.from_pretrained.return_value)
+        assert ort_model.from_pretrained.call_args.kwargs == {"file_name": "model_quantized.onnx"}
+        assert model is ort_model.from_pretrained.return_value
+        # The quantized files are removed once the model is loaded
+        save_dir = quantizer.return_value.quantize.call_args.kwargs["save_dir"]
+        assert ort_model.from_pretrained.call_args.args == (save_dir,)
+        assert not os.path.exists(save_dir)
+
+        quantizer.side_effect = RuntimeError("no VNNI")
+        with patch.dict(sys.modules, modules), pytest.warns(UserWarning, match="no VNNI"):
+            assert detectors._quantize_onnx_model(model) is model
+
+    def test_re2_engine_matches_re_engine(self):
+        """Test the RE2 engine produces the same masks as the default engine."""
+        pytest.importorskip("re2")
+        text = "Contact john@example.com or 555-123-4567 from 192.168.1.1. Nothing else here."
+
+        default = Sanitizer(Config(regex_only=True)).sanitize(text)
+        prefiltered = Sanitizer(Config(regex_only=True, regex_engine="re2")).sanitize(text)
+        assert prefiltered == default
+        assert Sanitizer(Config(regex_engine="re2")).sanitize("no pii") == ("no pii", {})
+
+        # Non-ASCII text keeps the re engine's Unicode-aware word boundaries
+        unicode_text = "Téléphone:é+1 555 123 4567 et é123-45-6789"
+        assert Sanitizer(Config(regex_only=True, regex_engine="re2")).sanitize(
+            unicode_text
+        ) == Sanitizer(Config(regex_only=True)).sanitize(unicode_text)
+
+    def test_hyperscan_engine_matches_re_engine(self):
+        """Test the Hyperscan prefilter produces the same detections as the default engine."""
+        pytest.importorskip("hyperscan")
+        from maskingengine.detectors import RegexDetector
+
+        text = "Mail john@example.com, call (555) 123-4567 or 555-987-6543 from 2001:db8::1"
+        default = RegexDetector(Config(regex_only=True))
+        hyperscan = RegexDetector(Config(regex_only=True, regex_engine="hyperscan"))
+        assert hyperscan._prefilter is not None
+        assert hyperscan.detect(text) == default.detect(text)
+        assert hyperscan.detect("nothing to see") == []
+
+        # The compiled database is built once and shared by later detectors
+        again = RegexDetector(Config(regex_only=True, regex_engine="hyperscan"))
+        assert again._prefilter is hyperscan._prefilter
+
+    def test_auto_engine_picks_installed_engine(self):
+        """Test the "auto" engine prefers Hyperscan, then RE2, then re."""
+        from unittest.mock import patch
+        from maskingengine import detectors
+
+        config = Config(regex_only=True, regex_engine="auto")
+        with patch.object(detectors, "hyperscan", None), patch.object(detectors, "re2", None):
+            assert detectors.RegexDetector(config).engine == "re"
+        with patch.object(detectors, "hyperscan", None):
+            expected = "re2" if detectors.re2 is not None else "re"
+            assert detectors.RegexDetector(config).engine == expected
+        expected = "hyperscan" if detectors.hyperscan is not None else expected
+        assert detectors.RegexDetector(config).engine == expected
+
+        with pytest.raises(ValueError):
+            Config(regex_engine="pcre")
+
+    def test_patterns_skipped_when_required_character_missing(self):
+        """Test patterns needing a character the text lacks are skipped without changing results."""
+        from maskingengine.detectors import RegexDetector, required_character
+
+        assert required_character(r"[\w.]+@[\w.]+\.[a-z]{2,}") == "@"
+        assert required_character(r"\(\d{3}\)\s?\d{3}-\d{4}") == "("
+        assert required_character(r"\b\d{3}(?:-\d{4})?\b") is None
+        assert required_character(r"\bEMP\d{6}\b") is None
+
+        detector = RegexDetector(Config(regex_only=True))
+        text = "Call 555-123-4567 or (555) 987-6543 about CUST-ABC-123"
+        kept = detector._patterns_without(frozenset("@+:_"))
+        assert "EMAIL" not in kept
+        assert detector.detect(text) == [
+            (pii_type, match.group(), match.start(), match.end())
+            for pii_type, patterns in detector.compiled_patterns.items()
+            for pattern in patterns
+            for match in pattern.finditer(text)
+        ]
+
+    def test_email_run_guard_keeps_matches(self):
+        """Test the email pattern's start guard finds what the unguarded pattern finds."""
+        import re
+        from maskingengine.detectors import RegexDetector, _prefilter_expression
+
+        detector = RegexDetector(Config(regex_only=True))
+        (guarded,) = detector.compiled_patterns["EMAIL"]
+        plain = re.compile(_prefilter_expression(guarded.pattern), guarded.flags)
+        assert "(?<" not in plain.pattern
+
+        text = "a@b.com-x@c.de 1.2.3@x.org ab1cd@ef.gh " + "9" * 5000 + " j@k.io"
+        expected = [m.span() for m in plain.finditer(text)]
+        assert [m.span() for m in guarded.finditer(text)] == expected
+        assert len(expected) == 5
+
+    def test_fused_type_patterns_match_separate_scans(self):
+        """Test the per-type alternation gate finds the same matches as scanning each pattern."""
+        from maskingengine.detectors import RegexDetector
+
+        detector = RegexDetector(Config(regex_only=True))
+        assert "PHONE" in detector.fused_patterns
+        text = "+33 1 23 45 67 89\n2001:db8::1 and (555) 123-4567, then 555-987-6543"
+
+        separate = [
+            (pii_type, match.group(), match.start(), match.end())
+            for pii_type, patterns in detector.compiled_patterns.items()
+            for pattern in patterns
+            for match in pattern.finditer(text)
+        ]
+        assert detector.detect(text) == separate
+
+    def test_ascii_text_scanned_as_bytes_matches_str_scan(self):
+        """Test ASCII text scanned with bytes patterns keeps str pattern semantics."""
+        from maskingengine.detectors import RegexDetector
+
+        detector = RegexDetector(Config(regex_only=True))
+        assert detector._ascii_patterns
+        for text in ("call 555-123-4567 now", "call 555\x1c123\x1c4567 now", "é 555-123-4567"):
+            expected = [
+                (pii_type, match.group(), match.start(), match.end())
+                for pii_type, patterns in detector.compiled_patterns.items()
+                for pattern in patterns
+                for match in pattern.finditer(text)
+            ]
+            assert detector.detect(text) == expected
+
+    def test_batch_scan_of_joined_texts_matches_separate_scans(self):
+        """Test scanning texts joined by newlines finds what scanning each text finds."""
+        from maskingengine.detectors import RegexDetector, _NEWLINE_SENSITIVE
+
+        detector = RegexDetector(Config(regex_only=True))
+        assert detector._joinable
+        # "555" and "123-4567" would form one phone number across the newline
+        texts = ["Mail a@example.com", "", "call 555", "123-4567 or 4111111111111111", "é 1.2.3.4"]
+        assert detector.detect_batch(texts) == [detector.detect(text) for text in texts]
+
+        assert _NEWLINE_SENSITIVE.search(r"\d+(?=\s)")
+        assert _NEWLINE_SENSITIVE.search(r"(?s)a.b")
+        assert not _NEWLINE_SENSITIVE.search(r"(?<!\d)\d{3}(?!\d)")
+
     def test_profiles_regex_only_setting(self):
         """Test that profiles correctly set regex_only mode."""
         from maskingengine.core import ConfigResolver
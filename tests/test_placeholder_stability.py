@@ -173,6 +173,28 @@ class TestPlaceholderStability:
         assert len(session1.seen_pii_hashes) >= 1  # Session 1 has processed PII
         assert len(session2.seen_pii_hashes) >= 1  # Session 2 has processed PII
 
+    def test_pii_hash_memo_is_released_with_session(self):
+        """Test hashed PII is memoized on the session rather than at module level."""
+        import gc
+        import weakref
+
+        session = StreamingMaskingSession(Config(regex_only=True), session_id="memo")
+        content = "Contact john@example.com and john@example.com"
+        session.process_chunk(
+            StreamingChunk(chunk_id=0, content=content, start_offset=0, end_offset=len(content))
+        )
+        assert ("EMAIL", "john@example.com") in session._pii_hash_memo
+
+        old_hash = session._get_pii_hash("john@example.com", "EMAIL")
+        session.reset_session()
+        assert session._pii_hash_memo == {}
+        assert session._get_pii_hash("john@example.com", "EMAIL") != old_hash
+
+        ref = weakref.ref(session)
+        del session
+        gc.collect()
+        assert ref() is None
+
     def test_session_statistics(self):
         """Test that session statistics are correctly maintained."""
         config = Config(regex_only=True)